@@ -24,5 +24,25 @@ class TestAbstractClasses(unittest.TestCase):
         with self.assertRaises(TypeError):
             amset = AbstractMutableSet[bool]()
 
+    def test_generic_subclass_registry(self):
+        from concrete_classes.list import MutableList
+        from concrete_classes.dict import MutableDict
+        self.assertIs(MutableList[int], MutableList[int])
+        self.assertIs(MutableList[(int,)], MutableList[int])
+        self.assertIs(MutableDict[str, int], MutableDict[str, int])
+        self.assertIsNot(MutableList[int], MutableList[str])
+
+    def test_no_instance_dict(self):
+        from concrete_classes.list import MutableList, ImmutableList
+        from concrete_classes.set import MutableSet, ImmutableSet
+        from concrete_classes.dict import MutableDict, ImmutableDict
+        from concrete_classes.maybe import Maybe
+        instances = (
+            MutableList[int](0), ImmutableList[int](0), MutableSet[int](0), ImmutableSet[int](0),
+            MutableDict[int, str]({0: 'a'}), ImmutableDict[int, str]({0: 'a'}), Maybe[int](0)
+        )
+        for instance in instances:
+            self.assertFalse(hasattr(instance, '__dict__'))
+
 if __name__ == '__main__':
     unittest.main()
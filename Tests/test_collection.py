@@ -6,8 +6,42 @@ from concrete_classes.list import MutableList, ImmutableList
 from concrete_classes.set import MutableSet, ImmutableSet
 
 
+# Module-level helpers shared by the tests, instead of lambdas recreated on every test call.
+def _double(x):
+    return x * 2
+
+
+def _increment(x):
+    return x + 1
+
+
+def _is_odd(x):
+    return x % 2 == 1
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+def _with_negated(x):
+    return [x, -x]
+
+
+def _is_negative(x):
+    return x < 0
+
+
+def _add(x, y):
+    return x + y
+
+
 class TestCollection(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.INT_LIST_123 = MutableList[int](1, 2, 3)
+        cls.INT_IMMUTABLE_LIST_123 = ImmutableList[int](1, 2, 3)
+
     def test_factory_constructors(self):
         lst = MutableList.of_iterable([0, 1, 2])
         self.assertEqual(lst, MutableList[int](0, 1, 2))
@@ -26,6 +60,12 @@ class TestCollection(unittest.TestCase):
         iml = ImmutableList[str]('x')
         self.assertTrue(iml)
         self.assertIn("ImmutableList[str]", repr(iml))
+        self.assertIs(repr(iml), repr(iml))
+
+        nested_iml = ImmutableList[list[int]]([0])
+        self.assertEqual(repr(nested_iml), "ImmutableList[list[int]][[0]]")
+        nested_iml.values[0].append(1)
+        self.assertEqual(repr(nested_iml), "ImmutableList[list[int]][[0, 1]]")
 
         empty_lst = MutableList[int]()
         self.assertFalse(empty_lst)
@@ -58,12 +98,27 @@ class TestCollection(unittest.TestCase):
         self.assertTrue('2' in mul)
         self.assertFalse(2 in mul)
         self.assertFalse({'d'} in mul)
+        self.assertTrue({'a', 'b', '2'} in mul)
+        self.assertTrue(['a', 'a'] in mul)
+        self.assertFalse(('a', 'd') in mul)
+        self.assertTrue([0, 1] in mus)
+        self.assertTrue(ImmutableSet[int](1, 2) in mus)
+        self.assertFalse(MutableList[int](2, 3) in mus)
+
+        mul_of_lists = MutableList[list[int]]([0, 1], [2])
+        self.assertTrue([0, 1] in mul_of_lists)
+        self.assertFalse([0] in mul_of_lists)
+        self.assertTrue([[0, 1], [2]] in mul_of_lists)
+        self.assertFalse([[0, 1], [3]] in mul_of_lists)
 
     def test_eq(self):
         mul = MutableList[int](0, 1)
         iml = ImmutableList[int](0, 1)
         self.assertEqual(mul, iml)
         self.assertNotEqual(mul, mul.reversed())
+        self.assertEqual(mul, mul)
+        self.assertNotEqual(mul, MutableList[int](0, 1, 2))
+        self.assertNotEqual(iml, ImmutableList[int](0))
 
         mus = MutableSet[str]('a', 'b')
         ims = ImmutableSet[str]('b', 'a')
@@ -88,48 +143,89 @@ class TestCollection(unittest.TestCase):
         self.assertEqual(nested_lst[1], new_nested_lst[1])
         self.assertIsNot(nested_lst[1], new_nested_lst[1])
 
+        iml = ImmutableList[int](1, 2)
+        self.assertIs(iml, iml.copy())
+        self.assertIsNot(iml, iml.copy(deep=True))
+
     def test_map_filter_flatmap(self):
-        lst = MutableList[int](1, 2, 3)
-        self.assertEqual(lst.map(lambda x: x * 2), MutableList[int](2, 4, 6))
-        self.assertEqual(lst.filter(lambda x: x % 2 == 1), MutableList[int](1, 3))
+        lst = self.INT_LIST_123
+        self.assertEqual(lst.map(_double), MutableList[int](2, 4, 6))
+        self.assertEqual(lst.filter(_is_odd), MutableList[int](1, 3))
         self.assertEqual(lst.flatmap(lambda x: [x, x + 10]), MutableList[int](1, 11, 2, 12, 3, 13))
 
-        iml = ImmutableList[int](1, 2, 3)
-        self.assertEqual(iml.map(lambda x: x + 1), ImmutableList[int](2, 3, 4))
-        self.assertEqual(iml.filter(lambda x: x % 2 == 1), ImmutableList[int]([1, 3]))
-        self.assertEqual(iml.flatmap(lambda x: [x, -x]), ImmutableList[int](1, -1, 2, -2, 3, -3))
+        iml = self.INT_IMMUTABLE_LIST_123
+        self.assertEqual(iml.map(_increment), ImmutableList[int](2, 3, 4))
+        self.assertEqual(iml.filter(_is_odd), ImmutableList[int]([1, 3]))
+        self.assertEqual(iml.flatmap(_with_negated), ImmutableList[int](1, -1, 2, -2, 3, -3))
 
         mus = MutableSet[int](1, 2)
-        self.assertEqual(mus.map(lambda x: x * 2), MutableSet[int](2, 4))
+        self.assertEqual(mus.map(_double), MutableSet[int](2, 4))
         self.assertEqual(mus.filter(lambda x: x > 1), MutableSet[int](2))
-        self.assertEqual(mus.map(lambda x: x + 1).filter(lambda x: x % 2 == 0), MutableSet[int](2))
-        self.assertEqual(mus.flatmap(lambda x: [x, -x]), MutableSet[int](1, -1, 2, -2))
+        self.assertEqual(mus.map(_increment).filter(_is_even), MutableSet[int](2))
+        self.assertEqual(mus.flatmap(_with_negated), MutableSet[int](1, -1, 2, -2))
 
         ims = ImmutableSet[int](1, 2)
-        self.assertEqual(ims.map(lambda x: x * 2), ImmutableSet[int](2, 4))
+        self.assertEqual(ims.map(_double), ImmutableSet[int](2, 4))
         self.assertEqual(ims.filter(lambda x: x > 1), ImmutableSet[int](2))
-        self.assertEqual(ims.map(lambda x: x + 1).filter(lambda x: x % 2 == 0), ImmutableSet[int](2))
-        self.assertEqual(ims.flatmap(lambda x: [x, -x]), ImmutableSet[int](1, -1, 2, -2))
+        self.assertEqual(ims.map(_increment).filter(_is_even), ImmutableSet[int](2))
+        self.assertEqual(ims.flatmap(_with_negated), ImmutableSet[int](1, -1, 2, -2))
+
+        self.assertEqual(lst.filter_map(_double, lambda x: x > 2), MutableList[int](4, 6))
+        self.assertEqual(iml.filter_map(str, str.isdigit, str), ImmutableList[str]('1', '2', '3'))
+        self.assertEqual(mus.filter_map(_increment, _is_odd, float), MutableSet[float](3.0))
+        self.assertEqual(ims.filter_map(_double, _is_negative, int), ImmutableSet[int]())
+
+        nested = MutableList[list[int]]([[1], [2, 3]])
+        self.assertEqual(nested.filter(lambda x: len(x) > 2), MutableList[list[int]]())
+        self.assertEqual(nested.filter(lambda x: len(x) > 1).values, [[2, 3]])
+
+        self.assertEqual(lst.flatmap(lambda x: range(x)), MutableList[int](0, 0, 1, 0, 1, 2))
+        with self.assertRaises(TypeError):
+            lst.flatmap(str)
+        with self.assertRaises(TypeError):
+            lst.flatmap(_double)
 
     def test_any_all_none_match(self):
         iml = ImmutableList[int](1, 2, 3, 4, 6, 12)
         self.assertTrue(iml.all_match(lambda n: 12 % n == 0))
-        self.assertFalse(iml.any_match(lambda n: n < 0))
-        self.assertTrue(iml.none_match(lambda n: n < 0))
+        self.assertFalse(iml.any_match(_is_negative))
+        self.assertTrue(iml.none_match(_is_negative))
 
     def test_reduce(self):
         mul = MutableList[int](0, 1, 2, 3)
-        sum_bin_op = lambda x, y: x + y
+        sum_bin_op = _add
         self.assertEqual(mul.reduce(sum_bin_op), 6)
 
-        self.assertEqual(ImmutableList[int]().reduce(lambda x, y: x + y, 0), 0)
+        self.assertEqual(ImmutableList[int]().reduce(_add, 0), 0)
 
         str_lst = ImmutableList[str]('J', 'A', 'V', 'A')
-        self.assertEqual(str_lst.reduce(lambda s1, s2: s1 + s2, '_'), '_JAVA')
+        self.assertEqual(str_lst.reduce(_add, '_'), '_JAVA')
 
         with self.assertRaises(TypeError):
             mul.reduce(sum_bin_op, unit='a')
 
+        from operator import add
+        self.assertEqual(mul.reduce(add), 6)
+        self.assertEqual(mul.reduce(add, 10), 16)
+        self.assertEqual(MutableSet[int](5).reduce(add), 5)
+        self.assertIs(MutableList[int](True).reduce(add), True)
+        self.assertEqual(ImmutableList[int]().reduce(add, 0), 0)
+        with self.assertRaises(TypeError):
+            ImmutableList[int]().reduce(add)
+
+        from operator import mul as mult
+        self.assertEqual(MutableList[int](2, 3, 4).reduce(mult), 24)
+        self.assertEqual(MutableList[int](2, 3, 4).reduce(mult, 0), 0)
+        self.assertEqual(ImmutableList[int]().reduce(mult, 1), 1)
+
+        self.assertEqual(MutableList[int](3, 1, 2).reduce(min), 1)
+        self.assertEqual(MutableList[int](3, 1, 2).reduce(max, 5), 5)
+        self.assertEqual(ImmutableSet[str]('b', 'a').reduce(max), 'b')
+        self.assertEqual(ImmutableList[int]().reduce(min, 7), 7)
+        self.assertIs(type(MutableList[int | float](1.0, 1).reduce(min)), float)
+        with self.assertRaises(TypeError):
+            ImmutableList[int]().reduce(max)
+
         mul = MutableList[list[int]]([0, 1], [1, 2])
 
         self.assertEqual(mul.reduce(sum_bin_op), [0, 1, 1, 2])
@@ -150,6 +246,8 @@ class TestCollection(unittest.TestCase):
         lst = MutableList[str]('a', 'b')
         lst.for_each(lambda x: acc.append(x.upper()))
         self.assertEqual(acc, ['A', 'B'])
+        self.assertIs(lst.peek(acc.append), lst)
+        self.assertEqual(acc, ['A', 'B', 'a', 'b'])
 
     def test_max_min(self):
         lst = MutableList[int](1, 2, 5, 2)
@@ -218,13 +316,15 @@ class TestCollection(unittest.TestCase):
         })
 
         self.assertEqual(ImmutableList[int]().group_by(abs), {})
+        self.assertEqual(ImmutableList[int]().partition_by(lambda x : x > 0), {})
+        self.assertEqual(ImmutableList[int](1, 2).partition_by(lambda x : x > 0), {True : ImmutableList[int](1, 2)})
 
         mus = MutableSet[int](-1, 1)
         st_grouped = mus.group_by(abs)
         self.assertEqual(st_grouped[1], mus)
 
     def test_map_thoroughly(self):
-        mul = MutableList[int](1, 2, 3)
+        mul = self.INT_LIST_123
         mapped_to_int = mul.map(lambda x : x+1)
         self.assertEqual(mapped_to_int, MutableList[int](2, 3, 4))
 
@@ -283,6 +383,30 @@ class TestCollection(unittest.TestCase):
         self.assertEqual(st, {'a', 'b'})
         self.assertNotEqual(st, {'a', 'b', 'c'})
 
+        # The same must hold when the values are validated instead of skipping validation.
+        mul_3 = MutableList[int](lst)
+        mul_3.append(3)
+        self.assertEqual(lst, [0, 1, 2])
+
+        mus_2 = MutableSet[str](st)
+        mus_2.add('c')
+        self.assertEqual(st, {'a', 'b'})
+
+        # Converting to a mutable built-in copies the values, while immutable ones are shared with no copy.
+        mul_3.to_list().append(4)
+        mus_2.to_set().add('d')
+        self.assertEqual(mul_3, MutableList[int](0, 1, 2, 3))
+        self.assertEqual(mus_2, MutableSet[str]('a', 'b', 'c'))
+        iml = ImmutableList[int](lst)
+        self.assertIs(iml.to_tuple(), iml.values)
+        ims = ImmutableSet[str](st)
+        self.assertIs(ims.to_frozen_set(), ims.values)
+
+    def test_init_from_generator(self):
+        self.assertEqual(MutableList[int](x for x in range(3)), MutableList[int](0, 1, 2))
+        self.assertEqual(ImmutableSet[int](x for x in range(3)), ImmutableSet[int](0, 1, 2))
+        self.assertEqual(MutableList[float](x for x in range(3)).values, [0.0, 1.0, 2.0])
+
     def test_of_values(self):
         with self.assertRaises(TypeError):
             MutableList[str].of_values(0, 1)
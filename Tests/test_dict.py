@@ -116,6 +116,10 @@ class DictionaryTest(unittest.TestCase):
 
         filtered_values = d.filter_values(lambda v: v.startswith('x') or v.startswith('a'))
         self.assertEqual(filtered_values.data, {0:'abc', 2:'xyz'})
+        self.assertIs(type(filtered_values), type(d))
+
+        imd = ImmutableDict[int, str]({0:'abc', 1:'def'})
+        self.assertEqual(imd.filter_keys(lambda k: k > 0), ImmutableDict[int, str]({1:'def'}))
 
     def test_subdict(self):
         # Basic subdict slicing
@@ -197,6 +201,15 @@ class DictionaryTest(unittest.TestCase):
         mud_2[4] = 'd'
         self.assertEqual(mud, MutableDict[int, str]({1 : 'a', 2 : 'b', 3 : 'c'}))
 
+        mud_3 = MutableDict[int, str](dic, _skip_validation=True)
+        mud_3[3] = 'c'
+        self.assertEqual(dic, {1 : 'a', 2 : 'b'})
+
+        mud_4 = mud_3.copy()
+        mud_4[4] = 'd'
+        self.assertEqual(mud_3, MutableDict[int, str]({1 : 'a', 2 : 'b', 3 : 'c'}))
+        self.assertEqual(ImmutableDict[int, str](mud_4, _skip_validation=True), mud_4.to_immutable_dict())
+
 
 if __name__ == '__main__':
     unittest.main()
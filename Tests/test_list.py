@@ -1,36 +1,86 @@
 import unittest
+from operator import lt, le, gt, ge
+from unittest.mock import Mock, patch
 
 
 from concrete_classes.list import MutableList, ImmutableList
 
 
+IntList, ImmutableIntList = MutableList[int], ImmutableList[int]
+FloatList, ImmutableFloatList = MutableList[float], ImmutableList[float]
+StrList, ImmutableStrList = MutableList[str], ImmutableList[str]
+
+
 class TestList(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Read-only: tests that mutate a list build their own.
+        cls.INT_LIST = IntList([10, 2, 4])
+        cls.SORT_INPUT = (5, 2, 9)
+        cls.STR_VALUES = ('zero', 'uno', 'dos', 'tres')
+        cls.STR_LIST = StrList(cls.STR_VALUES)
+        cls.INT_LIST_012 = IntList([0, 1, 2])
+        cls.INT_LIST_1223 = IntList(1, 2, 2, 3)
+        cls.UNSORTED_STR_LIST = StrList("b", "a", "c")
+
+        # Expected contents compared against the underlying values, without building a typed collection per assertion.
+        cls.EXPECTED_SORTED_ASC = ['a', 'b', 'x']
+        cls.EXPECTED_SORTED_DESC = ['x', 'c', 'b', 'a']
+        cls.EXPECTED_REVERSED = ['y', 'a', 'b', 'c', 'x']
+
     def test_multiple_value_init(self):
-        lst = MutableList[str]('a', 'b', 'c', 1, _coerce=True)
-        lst_2 = MutableList[str](['a', 'b', 'c', 1], _coerce=True)
+        lst = StrList('a', 'b', 'c', 1, _coerce=True)
+        lst_2 = StrList(['a', 'b', 'c', 1], _coerce=True)
         self.assertEqual(lst, lst_2)
 
     def test_class_name(self):
         from abstract_classes.generic_base import class_name
-        lst = MutableList[int]([0, 1, 2])
-        self.assertEqual(class_name(type(lst)), "MutableList[int]")
+        self.assertEqual(class_name(type(self.INT_LIST_012)), "MutableList[int]")
 
         iml = ImmutableList.of_values('a', 2, 0.1)
         self.assertEqual(class_name(type(iml)), "ImmutableList[int | str | float]")
+        self.assertEqual(class_name(list[MutableList[int]]), "list[MutableList[int]]")
+
+        self.assertEqual(class_name(int | str), "int | str")
+        self.assertEqual(class_name(str | int), "str | int")
+        self.assertEqual(class_name(list[int | str]), "list[int | str]")
+        self.assertEqual(class_name(list[str | int]), "list[str | int]")
+
+    def test_copy_and_slice_store_fresh_values(self):
+        mul = IntList(3, 1, 2)
+        spy = Mock(wraps=list)
+        with patch.object(IntList, '_skip_validation_finisher', spy):
+            copied = mul.copy()
+            sliced = mul[1:]
+            grouped = mul.group_by(lambda x: x % 2)
+            partitioned = mul.partition_by(lambda x: x > 1)
+        spy.assert_not_called()
+
+        self.assertEqual(copied, mul)
+        self.assertIsNot(copied.values, mul.values)
+        self.assertEqual(sliced.values, [1, 2])
+        self.assertEqual(grouped, {1: IntList(3, 1), 0: IntList(2)})
+        self.assertEqual(partitioned, {True: IntList(3, 2), False: IntList(1)})
 
     def test_init_and_access(self):
-        iml = ImmutableList[int](['1', 2], _coerce=True)
+        iml = ImmutableIntList(['1', 2], _coerce=True)
         self.assertEqual(iml.values, (1, 2))
         self.assertEqual(iml[0], 1)
 
-        mul = MutableList[int](iml)
+        mul = IntList(iml)
         self.assertEqual(list(iml.values), mul.values)
         self.assertEqual(iml.values, tuple(mul.values))
 
         mul_2 = MutableList.of_iterable(iml)
         self.assertEqual(mul, mul_2)
 
+        # Building a list from another one of the same type doesn't share its underlying container.
+        mul_3 = IntList(mul)
+        self.assertEqual(mul_3, mul)
+        self.assertIsNot(mul_3.values, mul.values)
+        self.assertEqual(MutableList[float](mul).values, [1.0, 2.0])
+
     def test_partial_init_parameters(self):
         # Creating a list without the type parameter [...] raises a TypeError
         with self.assertRaises(TypeError):
@@ -43,35 +93,60 @@ class TestList(unittest.TestCase):
         iml = ImmutableList.of_iterable([1, 2, '3'])
         self.assertEqual(iml.item_type, int | str)
 
-        empty_list = MutableList[str].empty()
+        empty_list = StrList.empty()
         self.assertEqual(len(empty_list), 0)
         self.assertFalse(empty_list)
 
     def test_type_coercion(self):
         # '1' is coerced to int when _coerce parameter is set to True
-        lst = MutableList[int](['1', 2], _coerce=True)
+        lst = IntList(['1', 2], _coerce=True)
         self.assertEqual(lst.values, [1, 2])
 
         # 1 is coerced to float even when _coerce parameter is False
         iml = ImmutableList[float]([1, 2.25], _coerce=False)
         self.assertEqual(iml.values, (1.0, 2.25))
+        self.assertIs(type(iml[0]), float)
         # This is because Python considers it equal to both the int and a float representation of 1
         self.assertEqual(iml[0], 1)
         self.assertEqual(iml[0], 1.0)
 
         # '3' is not coerced to int if _coerce parameter is False, and a TypeError is raised.
         with self.assertRaises(TypeError):
-            mul = MutableList[int]([1, 2, '3'], _coerce=False)
+            mul = IntList([1, 2, '3'], _coerce=False)
+
+        # Unions of classes and subclasses of the item type are validated without coercion.
+        self.assertEqual(MutableList[int | str]([1, 'a', True]).values, [1, 'a', True])
+        self.assertEqual(type(ImmutableList[float]([1, 2.5])[0]), float)
+        with self.assertRaises(TypeError):
+            MutableList[int | str]([1, 'a', 2.5])
+
+        # Coercions of whole iterables keep the same results as coercing each value on its own.
+        self.assertEqual(StrList(['a', 1, 2.5, True], _coerce=True).values, ['a', '1', '2.5', 'True'])
+        self.assertEqual(IntList([True, '2', 3], _coerce=True).values, [True, 2, 3])
+        with self.assertRaises(TypeError):
+            IntList(['1', '2.5'], _coerce=True)
 
     def test_immutability(self):
-        iml = ImmutableList[str](['a', 'b'])
+        iml = ImmutableStrList(['a', 'b'])
         with self.assertRaises(TypeError):
             iml[0] = 'c'
         with self.assertRaises(TypeError):
             iml.values[0] = 'c'
 
+    def test_hash(self):
+        iml = ImmutableIntList(1, 2)
+        self.assertEqual(hash(iml), hash(ImmutableIntList(1, 2)))
+        self.assertEqual(hash(iml), hash(iml))
+        self.assertEqual(hash(iml[0:1]), hash(ImmutableIntList(1)))
+        self.assertEqual(len({iml, ImmutableIntList(1, 2), ImmutableIntList(2, 1)}), 2)
+        self.assertNotIn(ImmutableFloatList(1.0, 2.0), {iml})
+        with self.assertRaises(TypeError):
+            hash(ImmutableList[list[int]]([1]))
+        with self.assertRaises(TypeError):
+            hash(IntList(1, 2))
+
     def test_setitem_and_delitem(self):
-        lst = MutableList[int]([1, 2, 3])
+        lst = IntList([1, 2, 3])
         lst[1] = 10
         self.assertEqual(lst.values, [1, 10, 3])
 
@@ -82,8 +157,8 @@ class TestList(unittest.TestCase):
         self.assertEqual(lst.values, [5, 6])
 
     def test_init_and_get(self):
-        int_lst = MutableList[int]([0, 1, 2])
-        str_lst = MutableList[str](['a', 'b', 2, 0.4], _coerce=True)
+        int_lst = self.INT_LIST_012
+        str_lst = StrList(['a', 'b', 2, 0.4], _coerce=True)
 
         self.assertEqual(int_lst[0], 0)
         self.assertEqual(int_lst[1], 1)
@@ -97,31 +172,38 @@ class TestList(unittest.TestCase):
         self.assertNotEqual(str_lst[3], 0.4)
 
     def test_comparisons(self):
-        lst = MutableList[int]([10, 2, 4])
-
-        self.assertTrue(lst > MutableList[int]([9, 15, 27]))
-        self.assertTrue(lst < MutableList[int]([10, 2, 5]))
-
-        self.assertTrue(lst > ImmutableList[int]([9, 15, 27]))
-        self.assertTrue(lst < ImmutableList[int]([10, 2, 5]))
-
-        self.assertTrue(lst <= lst)
-        self.assertTrue(lst >= ImmutableList[int](lst))
-        self.assertFalse(lst < lst)
-        self.assertFalse(ImmutableList[int](lst) > lst)
-
-        self.assertTrue(lst > MutableList[int]((10, 1, 5)))
-        self.assertTrue(lst < MutableList[int]([11, 100, 100]))
+        lst = self.INT_LIST
+        cases = (
+            (gt, IntList([9, 15, 27]), True),
+            (lt, IntList([10, 2, 5]), True),
+            (gt, ImmutableIntList([9, 15, 27]), True),
+            (lt, ImmutableIntList([10, 2, 5]), True),
+            (le, lst, True),
+            (ge, ImmutableIntList(lst), True),
+            (lt, lst, False),
+            (lt, ImmutableIntList(lst), False),
+            (gt, IntList((10, 1, 5)), True),
+            (lt, IntList([11, 100, 100]), True),
+        )
+        for op, other, expected in cases:
+            with self.subTest(op=op.__name__, other=other):
+                self.assertIs(op(lst, other), expected)
+
+        iml = ImmutableIntList(lst)
+        greater = ImmutableIntList(10, 1)
+        for op, other, expected in ((le, iml, True), (gt, iml, False), (ge, greater, True), (lt, greater, False)):
+            with self.subTest(op=op.__name__, other=other):
+                self.assertIs(op(iml, other), expected)
 
     def test_add_mul(self):
-        mul_a = MutableList[float](0.1)
-        iml_a = ImmutableList[float](0.1)
+        mul_a = FloatList(0.1)
+        iml_a = ImmutableFloatList(0.1)
 
-        mul_b = MutableList[float](1)
-        iml_b = ImmutableList[float](1)
+        mul_b = FloatList(1)
+        iml_b = ImmutableFloatList(1)
 
-        mul_sum_a_b = MutableList[float]([0.1, 1])
-        iml_sum_a_b = ImmutableList[float]([0.1, 1])
+        mul_sum_a_b = FloatList([0.1, 1])
+        iml_sum_a_b = ImmutableFloatList([0.1, 1])
 
         self.assertEqual(mul_a + mul_b, mul_sum_a_b)
         self.assertEqual(mul_a + mul_b, iml_sum_a_b)
@@ -133,11 +215,14 @@ class TestList(unittest.TestCase):
         self.assertTrue(isinstance(iml_a + iml_b, ImmutableList))
         self.assertTrue(isinstance(mul_a + mul_b, MutableList))
 
-        self.assertEqual(MutableList[int]([0, 1]) * 2, MutableList[int]([0, 1, 0, 1]))
+        self.assertEqual(IntList([0, 1]) * 2, IntList([0, 1, 0, 1]))
+        self.assertEqual(3 * ImmutableIntList(1), ImmutableIntList(1, 1, 1))
+        self.assertIsInstance((ImmutableIntList(1) * 2).values, tuple)
+        self.assertIsInstance((2 * IntList(1)).values, list)
 
     def test_contains_iter(self):
-        values = ['zero', 'uno', 'dos', 'tres']
-        lst = MutableList[str](values)
+        values = self.STR_VALUES
+        lst = self.STR_LIST
         self.assertTrue('zero' in lst)
         i = 0
         for s in lst:
@@ -145,66 +230,74 @@ class TestList(unittest.TestCase):
             i+=1
 
     def test_sort_and_sorted(self):
-        lst = MutableList[int](5, 2, 9)
+        lst = IntList(self.SORT_INPUT)
         lst.sort()
         self.assertEqual(lst.values, [2, 5, 9])
 
         lst.sort(reverse=True)
         self.assertEqual(lst.values, [9, 5, 2])
 
-        iml = ImmutableList[int](lst)
+        iml = ImmutableIntList(lst)
         self.assertEqual(iml.sorted().values, (2, 5, 9))
         self.assertEqual(iml.sorted(reverse=True).values, (9, 5, 2))
 
     def test_conversions(self):
-        lst = MutableList[str]('a', 'b')
-        self.assertEqual(lst.to_list(), ['a', 'b'])
-        self.assertEqual(lst.to_tuple(), ('a', 'b'))
-        self.assertEqual(lst.to_set(), {'a', 'b'})
-        self.assertEqual(lst.to_frozen_set(), frozenset({'a', 'b'}))
+        lst = StrList('a', 'b')
+        cases = (
+            (lst.to_list, ['a', 'b']),
+            (lst.to_tuple, ('a', 'b')),
+            (lst.to_set, {'a', 'b'}),
+            (lst.to_frozen_set, frozenset({'a', 'b'})),
+        )
+        for conversion, expected in cases:
+            with self.subTest(conversion=conversion.__name__):
+                self.assertEqual(conversion(), expected)
 
     def test_count(self):
-        lst = MutableList[int](1, 2, 2, 3)
+        lst = self.INT_LIST_1223
         self.assertEqual(lst.count(2), 2)
         self.assertEqual(lst.count(1), 1)
         self.assertEqual(lst.count(3), 1)
 
     def test_index(self):
-        lst = MutableList[int](10, 20, 30)
+        lst = IntList(10, 20, 30)
         self.assertEqual(lst.index(20), 1)
 
     def test_reversed(self):
-        lst = MutableList[int](1, 2, 3)
-        self.assertEqual(list(reversed(lst)), [3, 2, 1])
+        self.assertEqual(list(reversed(self.INT_LIST_012)), [2, 1, 0])
 
     def test_sorted_methods(self):
-        lst = MutableList[str]("b", "a", "c")
-        self.assertEqual(lst.sorted(), MutableList[str]("a", "b", "c"))
-        self.assertEqual(lst, MutableList[str]("b", "a", "c"))
-        self.assertEqual(lst.sorted(reverse=True), MutableList[str]("c", "b", "a"))
+        lst = self.UNSORTED_STR_LIST
+        self.assertEqual(lst.sorted(), StrList("a", "b", "c"))
+        self.assertEqual(lst.values, ["b", "a", "c"])
+        self.assertEqual(lst.sorted(reverse=True), StrList("c", "b", "a"))
 
     def test_inplace_sort_reverse(self):
-        mul = MutableList[str]('a', 'x', 'b')
+        mul = StrList('a', 'x', 'b')
         mul.sort()
-        self.assertEqual(mul, MutableList.of_values('a', 'b', 'x'))
+        self.assertEqual(mul.values, self.EXPECTED_SORTED_ASC)
         mul.append('c')
         mul.sort(reverse=True)
-        self.assertEqual(mul, MutableList.of_values('x', 'c', 'b', 'a'))
+        self.assertEqual(mul.values, self.EXPECTED_SORTED_DESC)
         mul.append('y')
         mul.reverse()
-        self.assertEqual(mul, MutableList.of_values('y', 'a', 'b', 'c', 'x'))
+        self.assertEqual(mul.values, self.EXPECTED_REVERSED)
 
     def test_invalid_set_values(self):
         with self.assertRaises(TypeError):
-            MutableList[int]({1, 2, 3})
+            IntList({1, 2, 3})
+        with self.assertRaises(TypeError):
+            MutableList[tuple[str, int]](('a', 1), (2, 'b'))
+        with self.assertRaises(TypeError):
+            MutableList[dict[str, int]]({'a': 1}, {'b': 'c'})
 
     def test_invalid_append(self):
-        lst = MutableList[int]()
+        lst = IntList()
         with self.assertRaises(TypeError):
             lst.append("string")
 
     def test_append(self):
-        int_lst = MutableList[int]()
+        int_lst = IntList()
         # '0' is safely coerced to int when _coerce = True
         int_lst.append('0', _coerce=True)
         self.assertEqual(int_lst[0], 0)
@@ -213,41 +306,54 @@ class TestList(unittest.TestCase):
             int_lst.append('1', _coerce=False)
 
         # 0 and 1 will be coerced to str no matter if _coerce is set to True or not.
-        str_lst = MutableList[str]()
+        str_lst = StrList()
         str_lst.append(0, _coerce=True)
         str_lst.append(1, _coerce=True)
         self.assertEqual(str_lst[0], '0')
         self.assertEqual(str_lst[1], '1')
 
     def test_invalid_setitem(self):
-        lst = MutableList[int](1, 2)
+        lst = IntList(1, 2)
         with self.assertRaises(TypeError):
             lst[0] = "oops"
 
     def test_distinct(self):
-        mul = MutableList[str]('a', 'a', 'b', 'b', 'b', 'c').distinct()
-        other_mul = MutableList[str]('a', 'b', 'c')
+        mul = StrList('a', 'a', 'b', 'b', 'b', 'c').distinct()
+        other_mul = StrList('a', 'b', 'c')
         self.assertEqual(mul, other_mul)
 
         iml = ImmutableList[tuple[str, int]](('a', 1), ('b', 2), ('c', 1))
         self.assertEqual(iml.distinct(lambda tup: tup[1]), ImmutableList.of_values(('a', 1), ('b', 2)))
 
+        unhashable = MutableList[list[int]]([1], [2], [1], [3])
+        self.assertEqual(unhashable.distinct(), MutableList[list[int]]([1], [2], [3]))
+        self.assertEqual(unhashable.distinct(len), MutableList[list[int]]([[1]]))
+
+        calls = []
+        def counted_key(value):
+            calls.append(value)
+            return [value[0] % 2]
+        self.assertEqual(unhashable.distinct(counted_key), MutableList[list[int]]([1], [2]))
+        self.assertEqual(len(calls), len(unhashable))
+
     def test_in_place_add_mul_sub(self):
-        mul = MutableList[str]('a')
-        mul += ImmutableList[str]('b')
-        self.assertEqual(mul, MutableList[str]('a', 'b'))
+        mul = StrList('a')
+        mul += ImmutableStrList('b')
+        self.assertEqual(mul.values, ['a', 'b'])
 
-        mul = MutableList[str]('a')
+        mul = StrList('a')
+        mul_before = mul
         mul *= 3
-        self.assertEqual(mul, MutableList[str]('a', 'a', 'a'))
+        self.assertIs(mul, mul_before)
+        self.assertEqual(mul.values, ['a', 'a', 'a'])
 
         with self.assertRaises(TypeError):
             mul *= 'c'
 
     def test_inplace_filter(self):
-        mul = MutableList[str]('a', 'b', 'abc')
+        mul = StrList('a', 'b', 'abc')
         mul.filter_inplace(lambda s : s.startswith('a'))
-        self.assertEqual(mul, MutableList[str]('a', 'abc'))
+        self.assertEqual(mul, StrList('a', 'abc'))
 
         mul.replace('abc', 123, _coerce=True)
         self.assertEqual(mul, MutableList.of_values('a', '123'))
@@ -259,5 +365,12 @@ class TestList(unittest.TestCase):
         mul.replace_many({'a' : 'b', '1' : 2}, _coerce=True)
         self.assertEqual(mul, MutableList.of_values('b', '2'))
 
+        nested = MutableList[list[int]]([1], [2])
+        nested.map_inplace(lambda l : l + [0])
+        self.assertEqual(nested.values, [[1, 0], [2, 0]])
+        with self.assertRaises(TypeError):
+            nested.map_inplace(len)
+        self.assertEqual(nested.values, [[1, 0], [2, 0]])
+
 if __name__ == '__main__':
     unittest.main()
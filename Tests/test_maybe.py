@@ -6,46 +6,57 @@ from concrete_classes.set import MutableSet
 from concrete_classes.maybe import Maybe
 
 
+IntMaybe, StrMaybe = Maybe[int], Maybe[str]
+
+
 class TestMaybe(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Empty Maybes are immutable, so a single one per item type is shared by the tests that don't test empty itself.
+        cls.EMPTY_INT = IntMaybe.empty()
+        cls.EMPTY_STR = StrMaybe.empty()
+
     def test_init(self):
-        self.assertEqual(Maybe[int](2).get(), 2)
-        self.assertEqual(Maybe[int](2), Maybe.of(2))
+        self.assertEqual(IntMaybe(2).get(), 2)
+        self.assertEqual(IntMaybe(2), Maybe.of(2))
         with self.assertRaises(TypeError):
-            mb = Maybe[int]('2', _coerce=False)
+            mb = IntMaybe('2', _coerce=False)
 
-        self.assertEqual(Maybe[int]('2', _coerce=True).get(), 2)
-        self.assertEqual(Maybe[str](2, _coerce=True).get(), '2')
-        self.assertEqual(Maybe[str](3.14, _coerce=True).get(), '3.14')
+        self.assertEqual(IntMaybe('2', _coerce=True).get(), 2)
+        self.assertEqual(StrMaybe(2, _coerce=True).get(), '2')
+        self.assertEqual(StrMaybe(3.14, _coerce=True).get(), '3.14')
 
     def test_get_present_empty(self):
         with self.assertRaises(ValueError):
-            Maybe[int].empty().get()
+            IntMaybe.empty().get()
 
-        self.assertTrue(Maybe[str].empty().is_empty())
+        self.assertTrue(StrMaybe.empty().is_empty())
+        self.assertIs(StrMaybe.empty(), StrMaybe.empty())
+        self.assertIs(Maybe.of_nullable(None, str), StrMaybe.empty())
         self.assertTrue(Maybe.of(2).is_present())
 
     def test_or_else(self):
-        self.assertEqual(Maybe[int].empty().or_else(3), 3)
+        self.assertEqual(self.EMPTY_INT.or_else(3), 3)
         with self.assertRaises(TypeError):
-            Maybe[int].empty().or_else('a')
-        self.assertEqual(Maybe[str].empty().or_else_get(lambda:""), "")
+            self.EMPTY_INT.or_else('a')
+        self.assertEqual(self.EMPTY_STR.or_else_get(lambda:""), "")
 
     def test_map(self):
-        mb1 = Maybe[int](1)
+        mb1 = IntMaybe(1)
         mb2 = mb1.map(lambda x : x + 1)
-        self.assertEqual(mb2, Maybe[int](2))
+        self.assertEqual(mb2, IntMaybe(2))
 
         with self.assertRaises(ValueError):
-            Maybe[int].empty().map(lambda x : 2*x)
+            self.EMPTY_INT.map(lambda x : 2*x)
 
         mb3 = mb1.map(lambda x : f'{x}{x}', int, _coerce=True)
-        self.assertEqual(mb3, Maybe[int](11))
+        self.assertEqual(mb3, IntMaybe(11))
 
         mb4 = mb1.map(lambda x : x + 1, str, _coerce=True)
-        self.assertEqual(mb4, Maybe[str]('2'))
+        self.assertEqual(mb4, StrMaybe('2'))
 
-        mb5 = Maybe[int].empty().map_or_else(lambda x : x + 1, 0)
+        mb5 = self.EMPTY_INT.map_or_else(lambda x : x + 1, 0)
         self.assertEqual(mb5, 0)
 
     def test_repr(self):
@@ -55,6 +66,12 @@ class TestMaybe(unittest.TestCase):
         mb2 = Maybe.of(MutableList[MutableSet[int]](MutableSet.of_values(0, 1), MutableSet.of_values(0, -1)))
         self.assertIn('Maybe[MutableList[MutableSet[int]]]', repr(mb2))
 
+    def _assert_all_raise(self, mb: Maybe, exception: type[Exception], *operations: Callable[[Maybe], Any]) -> None:
+        for i, operation in enumerate(operations):
+            with self.subTest(exception=exception.__name__, operation=i):
+                with self.assertRaises(exception):
+                    operation(mb)
+
     def test_getattr(self):
         class Dummy:
             def __init__(self, num: int):
@@ -65,16 +82,7 @@ class TestMaybe(unittest.TestCase):
 
         mb = Maybe.of(Dummy(2))
         self.assertEqual(mb.get_double(), 4)
-        with self.assertRaises(TypeError):
-            len(mb)
-        with self.assertRaises(TypeError):
-            mb(1)
-        with self.assertRaises(TypeError):
-            2 in mb
-        with self.assertRaises(TypeError):
-            for x in mb: pass
-        with self.assertRaises(TypeError):
-            len(mb)
+        self._assert_all_raise(mb, TypeError, len, lambda m: m(1), lambda m: 2 in m, list)
 
         mb = Maybe.of([0, 1, 2])
         mb.append(3)
@@ -85,15 +93,9 @@ class TestMaybe(unittest.TestCase):
         with self.assertRaises(IndexError):
             mb[4]
 
-        mb = Maybe[str].empty()
-        with self.assertRaises(AttributeError):
-            mb.startswith('_')
-        with self.assertRaises(ValueError):
-            len(mb)
-        with self.assertRaises(ValueError):
-            mb(1)
-        with self.assertRaises(ValueError):
-            for x in mb: pass
+        mb = self.EMPTY_STR
+        self._assert_all_raise(mb, AttributeError, lambda m: m.startswith('_'))
+        self._assert_all_raise(mb, ValueError, len, lambda m: m(1), list)
 
         mb = Maybe.of(lambda x : x + 1)
         self.assertEqual(mb(1), 2)
@@ -4,20 +4,36 @@ from concrete_classes.list import MutableList
 from concrete_classes.set import MutableSet, ImmutableSet
 
 
+IntSet, ImmutableIntSet = MutableSet[int], ImmutableSet[int]
+
+
 class TestSet(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.MUS_0, cls.IMS_0 = IntSet(0), ImmutableIntSet(0)
+        cls.MUS_1, cls.IMS_1 = IntSet(1), ImmutableIntSet(1)
+        cls.MUS_01 = IntSet(0, 1)
+
     def test_basic_init(self):
-        mus = MutableSet[int](1, '2', 2, _coerce=True)
+        mus = IntSet(1, '2', 2, _coerce=True)
         self.assertEqual(mus.values, {1, 2})
 
-        ims = ImmutableSet[int]('1', 2, '2', _coerce=True)
+        ims = ImmutableIntSet('1', 2, '2', _coerce=True)
         self.assertEqual(ims.values, frozenset({1, 2}))
 
+        st = {1, 2}
+        mus = IntSet(st)
+        mus.add(3)
+        self.assertEqual(st, {1, 2})
+        self.assertEqual(ImmutableIntSet(st).values, frozenset({1, 2}))
+        self.assertEqual(MutableSet[float](st).values, {1.0, 2.0})
+
     def test_type_coercion(self):
         with self.assertRaises(TypeError):
-            ImmutableSet[int]('1', 2)
+            ImmutableIntSet('1', 2)
 
-        self.assertEqual(ImmutableSet[int]('1', 2, _coerce=True).values, {1, 2})
+        self.assertEqual(ImmutableIntSet('1', 2, _coerce=True).values, {1, 2})
         self.assertEqual(MutableSet[str](2, '3', _coerce=True).values, {'2', '3'})
         self.assertEqual(MutableSet[str](2, '3', _coerce=True).values, {'2', '3'})
 
@@ -26,9 +42,16 @@ class TestSet(unittest.TestCase):
         with self.assertRaises(AttributeError):
             ims.add('c')
 
+    def test_hash(self):
+        self.assertEqual(hash(ImmutableIntSet(0, 1)), hash(ImmutableIntSet(1, 0)))
+        self.assertEqual(hash(self.IMS_0), hash(self.MUS_01.to_immutable_set() - {1}))
+        self.assertEqual(len({self.IMS_0, ImmutableIntSet(0), self.IMS_1}), 2)
+        with self.assertRaises(TypeError):
+            hash(self.MUS_0)
+
     def test_union_intersection(self):
-        s1 = MutableSet[int](1, 2)
-        s2 = ImmutableSet[int](2, 3)
+        s1 = IntSet(1, 2)
+        s2 = ImmutableIntSet(2, 3)
         self.assertEqual(s1.union(s2).values, {1, 2, 3})
         self.assertEqual(s1.union(s2), s2.union(s1))
         self.assertEqual(s1.intersection(s2).values, {2})
@@ -36,41 +59,50 @@ class TestSet(unittest.TestCase):
 
         self.assertEqual(
             s1.union(s2, [3, 4], [4, 5]),
-            MutableSet[int](1, 2, 3, 4, 5)
+            IntSet(1, 2, 3, 4, 5)
         )
 
-        s3 = MutableSet[int](1, '2', 3, 4, 5, 6, 7, 8, _coerce=True)
+        s3 = IntSet(1, '2', 3, 4, 5, 6, 7, 8, _coerce=True)
         self.assertEqual(
             s3.intersection(
                 {0, 1, 2, 3, 4, '5'},
                 {'a': 2, 'b': 3, 'c': 4, 'd': 5, 'e': 6, 'f': 7, 'g': 8, 'h': 9}.values(),
                 _coerce=True
             ),
-            MutableSet[int](2, 3, 4, 5)
+            IntSet(2, 3, 4, 5)
         )
 
     def test_difference_sym_dif(self):
-        s1 = MutableSet[int](1, 2, 3, 4)
-        s2 = MutableSet[int](2, 3, 4, 5)
-        s3 = MutableSet[int](1, 5, 6)
+        s1 = IntSet(1, 2, 3, 4)
+        s2 = IntSet(2, 3, 4, 5)
+        s3 = IntSet(1, 5, 6)
         lst = [6, 7]
         st = {7, 8}
 
-        self.assertEqual(s1.difference(s2).values, {1})
-        self.assertEqual(s1.symmetric_difference(s2), s2.symmetric_difference(s1))
-        self.assertEqual(s1.symmetric_difference(s2).values, {1, 5})
-        self.assertEqual(s1.symmetric_difference(s2, s3, lst, st).values, {8})
-        self.assertEqual(
-            s1.symmetric_difference(s2).symmetric_difference(s3),
-            s1.symmetric_difference(s2.symmetric_difference(s3))
+        cases = (
+            (lambda: s1.difference(s2).values, lambda: {1}),
+            (lambda: s1.symmetric_difference(s2), lambda: s2.symmetric_difference(s1)),
+            (lambda: s1.symmetric_difference(s2).values, lambda: {1, 5}),
+            (lambda: s1.symmetric_difference(s2, s3, lst, st).values, lambda: {8}),
+            (
+                lambda: s1.symmetric_difference(s2).symmetric_difference(s3),
+                lambda: s1.symmetric_difference(s2.symmetric_difference(s3))
+            ),
         )
+        for i, (actual, expected) in enumerate(cases):
+            with self.subTest(case=i):
+                self.assertEqual(actual(), expected())
+
+        # With nothing to combine, the result still holds its own copy of the values.
+        self.assertIsNot(s1.symmetric_difference().values, s1.values)
+        self.assertIsNot(s1.union().values, s1.values)
 
     def test_sub_super_set_disjoint(self):
         s1 = MutableSet[str]("a", 2, 3, "b", _coerce=True)
         s2 = MutableSet[str]("a", "1")
         s3 = MutableSet[str]("a", "b")
         s4 = ImmutableSet[str](2, 3, _coerce=True)
-        s5 = ImmutableSet[int]("2", "3", _coerce=True)
+        s5 = ImmutableIntSet("2", "3", _coerce=True)
 
         self.assertFalse(s2.is_subset(s1))
         self.assertEqual(s2.is_subset(s1), s1.is_superset(s2))
@@ -89,12 +121,9 @@ class TestSet(unittest.TestCase):
         self.assertEqual(s4.is_disjoint(s3), s3.is_disjoint(s4))
 
     def test_or_and(self):
-        mus_a = MutableSet[int](0)
-        ims_a = ImmutableSet[int](0)
-        mus_b = MutableSet[int](1)
-        ims_b = ImmutableSet[int](1)
-        mus_sum_a_b = MutableSet[int](0, 1)
-        ims_sum_a_b = ImmutableSet[int](0, 1)
+        mus_a, ims_a = self.MUS_0, self.IMS_0
+        mus_b, ims_b = self.MUS_1, self.IMS_1
+        mus_sum_a_b = self.MUS_01
 
         self.assertEqual(mus_a | mus_b, mus_sum_a_b)
         self.assertEqual(mus_a | ims_b, mus_sum_a_b)
@@ -112,10 +141,10 @@ class TestSet(unittest.TestCase):
 
         mus_c = MutableSet[int | str](2)
         self.assertEqual(mus_c | ims_a, ImmutableSet[int | str](0, 2))
-        self.assertEqual(mus_c & ims_b, ImmutableSet[int]())
+        self.assertEqual(mus_c & ims_b, ImmutableIntSet())
 
     def test_sub_super_set_disjoint_coercion(self):
-        st_int = MutableSet[int](0)
+        st_int = self.MUS_0
         st_int_str = MutableSet[int | str](0, 'a')
 
         self.assertTrue(st_int.is_subset(st_int_str))
@@ -124,7 +153,7 @@ class TestSet(unittest.TestCase):
         self.assertFalse(st_int.is_disjoint(st_int_str))
         self.assertFalse(st_int_str.is_disjoint(st_int))
 
-        st_int = MutableSet[int](0, 1)
+        st_int = self.MUS_01
         st_int_str = MutableSet[int | str](0)
 
         with self.assertRaises(ValueError):
@@ -148,27 +177,27 @@ class TestSet(unittest.TestCase):
         self.assertEqual(mus, MutableSet[str]('b'))
 
     def test_update(self):
-        mus = MutableSet[int](0, 1)
+        mus = IntSet(0, 1)
         mus.update([2, 3], MutableList.of_values(4, 5))
 
-        self.assertEqual(mus, MutableSet[int](0, 1, 2, 3, 4, 5))
+        self.assertEqual(mus, IntSet(0, 1, 2, 3, 4, 5))
 
         mus_2 = MutableSet.of_values(0, 1, 2, 3, 4, 5, 6, 7, 8)
-        mus_2.difference_update([1, 3], {5, 27, 33}, MutableSet[int](-1, -3, 7))
-        self.assertEqual(mus_2, MutableSet[int](0, 2, 4, 6, 8))
+        mus_2.difference_update([1, 3], {5, 27, 33}, IntSet(-1, -3, 7))
+        self.assertEqual(mus_2, IntSet(0, 2, 4, 6, 8))
 
     def test_intersection_sym_difference_update_multiple_types(self):
-        s = MutableSet[int](1, 2, 3, 4, 5)
+        s = IntSet(1, 2, 3, 4, 5)
         s.intersection_update(
-            ImmutableSet[int](2, 3, 6),
+            ImmutableIntSet(2, 3, 6),
             MutableList[int](3, 4, 5),
             [3, 5, 7],
             {3, 5, 8}
         )
         self.assertEqual(s.values, {3})
 
-        mus = MutableSet[int](1, 2, 3)
-        ims = ImmutableSet[int](2, 3, 4)
+        mus = IntSet(1, 2, 3)
+        ims = ImmutableIntSet(2, 3, 4)
         mul = MutableList[int](3, 4, 5)
         lst = [4, 5, 6]
         st = {5, 6, 7}
@@ -183,29 +212,32 @@ class TestSet(unittest.TestCase):
         self.assertEqual(len(s), 3)
         s.add('a')
         self.assertEqual(len(s), 4)
+        self.assertEqual(s.count('a'), 1)
+        self.assertEqual(s.count('b'), 0)
+        self.assertEqual(s.count(['a']), 0)
 
     def test_iter(self):
         values = {1, 2, 3, 4, 5}
-        ims = ImmutableSet[int](*values)
-        for n in ims:
-            self.assertIn(n, values)
+        ims = ImmutableIntSet(*values)
+        self.assertSetEqual(set(ims), values)
+        self.assertEqual(len(list(ims)), len(values))
 
     def test_in_place_updates(self):
-        st = MutableSet[int](0)
-        st |= ImmutableSet[int](0, 1, 2, 3) # Union = {0, 1, 2, 3}
-        self.assertEqual(st, MutableSet[int](0, 1, 2, 3))
+        st = IntSet(0)
+        st |= ImmutableIntSet(0, 1, 2, 3) # Union = {0, 1, 2, 3}
+        self.assertEqual(st, IntSet(0, 1, 2, 3))
 
-        st &= MutableSet[int](2, 3) # Intersection = {2, 3}
-        self.assertEqual(st, MutableSet[int](2, 3))
+        st &= IntSet(2, 3) # Intersection = {2, 3}
+        self.assertEqual(st, IntSet(2, 3))
 
         st -= ImmutableSet.of_iterable(frozenset({3, 4})) # Difference = {2}
-        self.assertEqual(st, ImmutableSet[int](2))
+        self.assertEqual(st, ImmutableIntSet(2))
 
-        st ^= ImmutableSet[int]({2, 0}) # Symmetric Difference = {0}
-        self.assertEqual(st, ImmutableSet[int](0))
+        st ^= ImmutableIntSet({2, 0}) # Symmetric Difference = {0}
+        self.assertEqual(st, ImmutableIntSet(0))
 
     def test_replace(self):
-        mus = MutableSet[int](0, 1, 2)
+        mus = IntSet(0, 1, 2)
         mus.replace(0, -5)
         self.assertEqual(mus, MutableSet.of_values(1, 2, -5))
 
@@ -220,17 +252,17 @@ class TestSet(unittest.TestCase):
         self.assertEqual(mus, MutableSet.of_values(1, 3))
 
     def test_or_and_xor_etc(self):
-        mus = MutableSet[int](0, 1)
-        mus_2 = MutableSet[int](1, 2)
+        mus = self.MUS_01
+        mus_2 = IntSet(1, 2)
         or_st = mus | mus_2
-        self.assertEqual(or_st, MutableSet[int](0, 1, 2))
+        self.assertEqual(or_st, IntSet(0, 1, 2))
         or_st = mus | MutableSet.of_iterable({1, 2})
-        self.assertEqual(or_st, MutableSet[int](0, 1, 2))
+        self.assertEqual(or_st, IntSet(0, 1, 2))
 
     def test_type_hierarchy(self):
-        mus = MutableSet[int](0)
-        mus_ = MutableSet[int](1)
-        ims = ImmutableSet[int](2)
+        mus = IntSet(0)
+        mus_ = IntSet(1)
+        ims = ImmutableIntSet(2)
         self.assertTrue(isinstance(mus | mus_, MutableSet))
         self.assertTrue(isinstance(mus | ims, ImmutableSet))
 
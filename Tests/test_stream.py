@@ -0,0 +1,61 @@
+import unittest
+
+from concrete_classes.list import MutableList, ImmutableList
+from concrete_classes.set import MutableSet, ImmutableSet
+
+
+class TestStream(unittest.TestCase):
+
+    def test_chained_operations(self):
+        mul = MutableList[int](1, 2, 3, 4)
+        result = mul.stream().map(lambda x: x * 10).filter(lambda x: x > 10).flatmap(lambda x: [x, -x]).to_collection()
+        self.assertEqual(result, MutableList[int](20, -20, 30, -30, 40, -40))
+
+        self.assertEqual(mul.stream().filter(lambda x: x % 2 == 0).to_collection(ImmutableSet), ImmutableSet[int](2, 4))
+        self.assertEqual(mul.stream().map(str, str).to_collection(), MutableList[str]('1', '2', '3', '4'))
+        self.assertEqual(mul.stream().map(str, int).to_collection(_coerce=True), mul)
+        with self.assertRaises(TypeError):
+            mul.stream().map(str, int).to_collection()
+
+        # The source is never modified, and the operations are only performed on a terminal operation.
+        seen = []
+        stream = ImmutableList[int](1, 2, 3).stream().peek(seen.append).map(lambda x: x + 1)
+        self.assertEqual(seen, [])
+        self.assertEqual(stream.to_collection(), ImmutableList[int](2, 3, 4))
+        self.assertEqual(seen, [1, 2, 3])
+
+    def test_terminal_operations(self):
+        mus = MutableSet[int](1, 2, 3)
+        self.assertTrue(mus.stream().map(lambda x: x * 2).all_match(lambda x: x % 2 == 0))
+        self.assertTrue(mus.stream().filter(lambda x: x > 2).any_match(lambda x: x == 3))
+        self.assertTrue(mus.stream().none_match(lambda x: x < 0))
+        self.assertEqual(mus.stream().map(lambda x: x * x).reduce(lambda x, y: x + y), 14)
+        self.assertEqual(mus.stream().filter(lambda x: x > 5).reduce(lambda x, y: x + y, 0), 0)
+
+        with self.assertRaises(TypeError):
+            mus.stream().flatmap(str).to_collection()
+
+    def test_reduce_validates_unit(self):
+        mus = MutableSet[int](1, 2, 3)
+        self.assertEqual(mus.stream().reduce(lambda x, y: x + y, 10), mus.reduce(lambda x, y: x + y, 10))
+        with self.assertRaises(TypeError):
+            mus.stream().reduce(lambda x, y: x + y, '0')
+        with self.assertRaises(TypeError):
+            mus.stream().filter(lambda x: x > 1).reduce(lambda x, y: x + y, 0.5)
+        # With an unknown item type there is nothing to check the unit against.
+        self.assertEqual(mus.stream().map(str).reduce(lambda x, y: x + y, ''), ''.join(map(str, mus)))
+
+    def test_to_collection_with_generic_class(self):
+        mul = MutableList[int](1, 2, 3)
+        with self.assertRaises(TypeError):
+            mul.stream().map(str).to_collection(MutableList[int])
+        with self.assertRaises(TypeError):
+            mul.stream().filter(lambda x: x > 1).to_collection(MutableList[str])
+        self.assertEqual(mul.stream().map(str).to_collection(MutableList[int], _coerce=True), mul)
+        self.assertEqual(mul.stream().filter(lambda x: x > 1).to_collection(MutableList[str], _coerce=True),
+                         MutableList[str]('2', '3'))
+        self.assertEqual(mul.stream().filter(lambda x: x > 1).to_collection(ImmutableSet[int]), ImmutableSet[int](2, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from typing import Any
+from typing import Any, Literal
 
 from abstract_classes.abstract_sequence import AbstractSequence
 from abstract_classes.abstract_set import AbstractSet
@@ -64,6 +64,13 @@ class TestGetSupertype(unittest.TestCase):
         self.assertFalse(_is_subtype(A | B_, A_ | B))
         self.assertFalse(_is_subtype(A_ | B_, A_ | _A_))
 
+        # Unions mixing plain classes and generics
+        self.assertTrue(_is_subtype(list[int] | A_, list | A))
+        self.assertTrue(_is_subtype(A_ | list[int], A | list[int | str]))
+        self.assertFalse(_is_subtype(A | list[int], A | list[str]))
+        self.assertTrue(_is_subtype(A_, list[int] | A))
+        self.assertFalse(_is_subtype(B, list[int] | A))
+
     def test_any_as_top_type(self):
         self.assertEqual(_get_supertype(int, Any), Any)
         self.assertEqual(_get_supertype(Any, int), Any)
@@ -74,6 +81,8 @@ class TestGetSupertype(unittest.TestCase):
 
         self.assertEqual(_get_supertype(int, int | Any), int | Any)
         self.assertTrue(_is_subtype(str, int | Any))
+        # Types with unhashable arguments can't be memoized, but are still compared.
+        self.assertTrue(_is_subtype(Literal[[0]], Any))
 
     def test_tuple(self):
         self.assertTrue(_is_subtype(tuple[int, ...], tuple[int | str, ...]))
@@ -20,6 +20,8 @@ class TestTypeInference(unittest.TestCase):
 
     def test_mixed_list(self):
         self.assertEqual(_infer_type([1, "a"]), list[int | str])
+        self.assertEqual(_infer_type([1, "a", [2.0]]), list[int | str | list[float]])
+        self.assertEqual(_infer_type([None, range(2), Dummy()]), list[None | range | Dummy])
 
     def test_dict_str_int(self):
         self.assertEqual(_infer_type({"a": 1, "b": 2}), dict[str, int])
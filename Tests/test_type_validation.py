@@ -11,26 +11,37 @@ from type_validation.type_validation import _validate_type
 
 class TestTypeValidation(unittest.TestCase):
 
+    def _assert_validations(self, *cases: tuple[object, type, bool]) -> None:
+        for obj, expected_type, expected in cases:
+            with self.subTest(obj=obj, expected_type=expected_type):
+                self.assertIs(_validate_type(obj, expected_type), expected)
+
     def test_validate_numeric_subtypes(self):
-        self.assertTrue(_validate_type(1, int))
-        self.assertFalse(_validate_type(1, float))
-        self.assertFalse(_validate_type(1.5, int))
-        self.assertTrue(_validate_type(1.5, float))
+        self._assert_validations(
+            (1, int, True),
+            (1, float, False),
+            (1.5, int, False),
+            (1.5, float, True),
+        )
 
     def test_validate_tuple(self):
         tpl = (1, 2, 3)
-        self.assertTrue(_validate_type(tpl, tuple[int, int, int]))
-        self.assertTrue(_validate_type(tpl, tuple[int, ...]))
-        self.assertTrue(_validate_type((1, 0.1, 1), tuple[int, float, int]))
-        self.assertFalse(_validate_type((1, 'a', 3), tuple[int, ...]))
-        self.assertFalse(_validate_type((1, 2.0), tuple[int, float, int]))
-        self.assertFalse(_validate_type((1, 2, 3, 4), tuple[int, float, int]))
+        self._assert_validations(
+            (tpl, tuple[int, int, int], True),
+            (tpl, tuple[int, ...], True),
+            ((1, 0.1, 1), tuple[int, float, int], True),
+            ((1, 'a', 3), tuple[int, ...], False),
+            ((1, 2.0), tuple[int, float, int], False),
+            ((1, 2, 3, 4), tuple[int, float, int], False),
+        )
 
     def test_validate_list(self):
         lst = [0, 1, 2, 3]
-        self.assertTrue(_validate_type(lst, list[int]))
-        self.assertFalse(_validate_type(lst, list[float]))
-        self.assertFalse(_validate_type(lst, tuple[int, ...]))
+        self._assert_validations(
+            (lst, list[int], True),
+            (lst, list[float], False),
+            (lst, tuple[int, ...], False),
+        )
 
     def test_validate_sets(self):
         self.assertTrue(_validate_type({1, 2, 3}, set[int]))
@@ -4,7 +4,7 @@ from typing import ClassVar, Callable, Any, Mapping, Iterable, TypeVar, Iterator
 
 from immutabledict import immutabledict
 
-from abstract_classes.generic_base import GenericBase, class_name, forbid_instantiation, _convert_to
+from abstract_classes.generic_base import GenericBase, class_name, forbid_instantiation, _convert_to, _has_frozen_repr, _object_setattr
 
 
 @forbid_instantiation
@@ -50,6 +50,8 @@ class AbstractDict[K, V](GenericBase):
         _eq_finisher (ClassVar[Callable[[Mapping], dict]]): It's applied to the data when comparing two objects.
     """
 
+    __slots__ = ()
+
     key_type: type[K]
     value_type: type[V]
     data: immutabledict[K, V]
@@ -109,13 +111,20 @@ class AbstractDict[K, V](GenericBase):
         if isinstance(key_type, TypeVar) or isinstance(value_type, TypeVar):
             raise TypeError(f"Generic types must be fully specified for {class_name(type(self))}. Use {class_name(type(self))}.of to infer types from iterable.")
 
-        object.__setattr__(self, "key_type", key_type)
-        object.__setattr__(self, "value_type", value_type)
+        _object_setattr(self, "key_type", key_type)
+        _object_setattr(self, "value_type", value_type)
 
         finisher = _finisher or getattr(type(self), '_finisher', lambda x : x)
 
+        # Already validated mappings are copied directly by the finisher, without splitting them into keys and values.
+        if _skip_validation and _keys is None and isinstance(keys_values, (dict, Mapping, AbstractDict)):
+            skip_validation_finisher = getattr(type(self), '_skip_validation_finisher', None) or finisher
+            source = keys_values.data if isinstance(keys_values, AbstractDict) else keys_values
+            _object_setattr(self, "data", skip_validation_finisher(source))
+            return
+
         if keys_values is None and (_keys is None or _values is None):
-            object.__setattr__(self, "data", finisher({}))
+            _object_setattr(self, "data", finisher({}))
             return
 
         keys: Iterable[K]
@@ -139,9 +148,9 @@ class AbstractDict[K, V](GenericBase):
 
         if _skip_validation:
             skip_validation_finisher = getattr(type(self), '_skip_validation_finisher', None) or finisher
-            object.__setattr__(self, "data", skip_validation_finisher(dict(zip(actual_keys, actual_values))))
+            _object_setattr(self, "data", skip_validation_finisher(dict(zip(actual_keys, actual_values))))
         else:
-            object.__setattr__(self, "data", finisher(dict(zip(actual_keys, actual_values))))
+            _object_setattr(self, "data", finisher(dict(zip(actual_keys, actual_values))))
 
     @classmethod
     def _inferred_key_value_types(cls: AbstractDict[K, V]) -> tuple[type[K] | None, type[V] | None]:
@@ -340,30 +349,52 @@ class AbstractDict[K, V](GenericBase):
 
         Two dictionaries are considered equal if they share the same key/value types and contents.
 
+        A dictionary is always equal to itself, and dictionaries with a different number of pairs are never equal. If
+        both underlying containers are of the same class, they are compared directly, without applying _eq_finisher,
+        and if both dictionaries are of the same class, their key and value types are known to match without comparing
+        them.
+
         :param other: The object to compare against.
         :type other: Any
 
         :return: True if `other` is an AbstractDict with the same key and values types and contents, False otherwise.
         :rtype: bool
         """
-        eq_finisher: Callable[[Iterable], Iterable] = getattr(type(self), '_eq_finisher', lambda x : x)
+        if self is other:
+            return True
+        if type(self) is type(other):
+            return self.data == other.data
         comparable_types: type[AbstractDict] = getattr(type(self), '_comparable_types', AbstractDict)
-        return (
-            isinstance(other, comparable_types)
-            and self.key_type == other.key_type
-            and self.value_type == other.value_type
-            and eq_finisher(self.data) == eq_finisher(other.data)
-        )
+        if (
+            not isinstance(other, comparable_types)
+            or self.key_type != other.key_type
+            or self.value_type != other.value_type
+            or len(self.data) != len(other.data)
+        ):
+            return False
+        if type(self.data) is type(other.data):
+            return self.data == other.data
+        eq_finisher: Callable[[Iterable], Iterable] = getattr(type(self), '_eq_finisher', lambda x : x)
+        return eq_finisher(self.data) == eq_finisher(other.data)
 
     def __repr__(self: AbstractDict[K, V]) -> str:
         """
         Returns a concise string representation of this AbstractDict, including its generic types for keys and values.
 
+        Immutable classes declaring a _repr_cache slot store their representation on it the first time it's computed,
+        as long as the repr of their keys and values can't change either.
+
         :return: A string representation of this AbstractDict.
         :rtype: str
         """
+        cached_repr = getattr(self, '_repr_cache', None)
+        if cached_repr is not None:
+            return cached_repr
         repr_finisher: Callable[[Iterable], Iterable] = getattr(type(self), '_repr_finisher', lambda x : x)
-        return f"{class_name(type(self))}{repr_finisher(self.data)}"
+        result = f"{class_name(type(self))}{repr_finisher(self.data)}"
+        if _has_frozen_repr(type(self)):
+            _object_setattr(self, '_repr_cache', result)
+        return result
 
     def __or__[D: AbstractDict](self: D, other: D) -> D:
         """
@@ -570,7 +601,7 @@ class AbstractDict[K, V](GenericBase):
         from abstract_classes.generic_base import base_class
         dict_subclass = base_class(self)
 
-        new_data = {key : f(value) for key, value in self.data.items()}
+        new_data = dict(zip(self.data.keys(), map(f, self.data.values())))
 
         if result_type is not None:
             new_value_type = result_type
@@ -590,7 +621,7 @@ class AbstractDict[K, V](GenericBase):
         :return: A new AbstractDict of the same dynamic subclass as self containing the filtered (key, value) pairs.
         :rtype: AbstractDict[K, V]
         """
-        return type(self)({key : value for key, value in self.data.items() if predicate(key)})
+        return type(self)({key : value for key, value in self.data.items() if predicate(key)}, _skip_validation=True)
 
     def filter_values(self: AbstractDict[K, V], predicate: Callable[[V], bool]) -> AbstractDict[K, V]:
         """
@@ -602,7 +633,7 @@ class AbstractDict[K, V](GenericBase):
         :return: A new AbstractDict of the same dynamic subclass as self containing the filtered (key, value) pairs.
         :rtype: AbstractDict[K, V]
         """
-        return type(self)({key : value for key, value in self.data.items() if predicate(value)})
+        return type(self)({key : value for key, value in self.data.items() if predicate(value)}, _skip_validation=True)
 
     def filter_items(self: AbstractDict[K, V], predicate: Callable[[K, V], bool]) -> AbstractDict[K, V]:
         """
@@ -614,7 +645,7 @@ class AbstractDict[K, V](GenericBase):
         :return: A new AbstractDict of the same dynamic subclass as self containing the filtered key-value pairs.
         :rtype: AbstractDict[K, V]
         """
-        return type(self)({key : value for key, value in self.data.items() if predicate(key, value)})
+        return type(self)({key : value for key, value in self.data.items() if predicate(key, value)}, _skip_validation=True)
 
 
 @forbid_instantiation
@@ -641,6 +672,8 @@ class AbstractMutableDict[K, V](AbstractDict[K, V]):
         _mutable (ClassVar[bool]): Metadata attribute describing the mutability of this class.
     """
 
+    __slots__ = ()
+
     key_type: type[K]
     value_type: type[V]
     data: dict[K, V]
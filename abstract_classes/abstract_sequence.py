@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import typing
 from collections import deque
-from collections.abc import Sequence
+from collections.abc import Sequence, Set
 from typing import ClassVar, Callable, Iterable, Any, Iterator
 
 from abstract_classes.abstract_set import AbstractSet
-from abstract_classes.collection import Collection, MutableCollection
+from abstract_classes.collection import Collection, MutableCollection, _type_validation
 from abstract_classes.generic_base import forbid_instantiation, _convert_to, class_name
 
 
@@ -41,9 +41,11 @@ class AbstractSequence[T](Collection[T]):
          values on the eq method to check for equality.
 
         _forbidden_iterable_types (ClassVar[tuple[type, ...]]): Overrides the _forbidden_iterable_types parameter of
-         Collection's init, setting it to (set, frozenset, AbstractSet, typing.AbstractSet).
+         Collection's init, setting it to (set, frozenset, AbstractSet, collections.abc.Set).
     """
 
+    __slots__ = ()
+
     item_type: type[T]
     values: tuple[T, ...]
 
@@ -52,7 +54,7 @@ class AbstractSequence[T](Collection[T]):
     _skip_validation_finisher: ClassVar[Callable[[Iterable], Iterable]] = tuple
     _repr_finisher: ClassVar[Callable[[Iterable], Iterable]] = _convert_to(list)
     _eq_finisher: ClassVar[Callable[[Iterable], Iterable]] = _convert_to(tuple)
-    _forbidden_iterable_types: ClassVar[tuple[type, ...]] = (set, frozenset, AbstractSet, typing.AbstractSet)
+    _forbidden_iterable_types: ClassVar[tuple[type, ...]] = (set, frozenset, AbstractSet, Set)
 
     def __getitem__(self: AbstractSequence[T], index: int | slice) -> T | AbstractSequence[T]:
         """
@@ -67,12 +69,30 @@ class AbstractSequence[T](Collection[T]):
 
         :raises TypeError: If index is not an int or slice.
         """
-        if isinstance(index, slice):
-            return type(self)(self.values[index])
-
         if isinstance(index, int):
             return self.values[index]
 
+        if isinstance(index, slice):
+            return type(self)._unchecked(self.values[index], _copy=False)
+
+    def _comparable_values(self: AbstractSequence[T], other: AbstractSequence[T]) -> tuple[Sequence, Sequence]:
+        """
+        Gets the values of this sequence and another in containers that can be lexicographically compared.
+
+        Values stored in the same kind of container are compared as they are, without copying them. Otherwise, both of
+        them are passed through the _eq_finisher callable attribute of the class, as a list can't be compared to a tuple.
+
+        :param other: Another AbstractSequence to compare with.
+        :type other: AbstractSequence[T]
+
+        :return: A tuple of the values of self and other, ready to be compared.
+        :rtype: tuple[Sequence, Sequence]
+        """
+        if type(self.values) is type(other.values):
+            return self.values, other.values
+        eq_finisher = getattr(type(self), '_eq_finisher', lambda x : x)
+        return eq_finisher(self.values), eq_finisher(other.values)
+
     def __lt__(self: AbstractSequence[T], other: AbstractSequence[T]) -> bool:
         """
         Checks if this sequence is lexicographically less than another.
@@ -85,8 +105,8 @@ class AbstractSequence[T](Collection[T]):
         """
         if not isinstance(other, AbstractSequence):
             return NotImplemented
-        eq_finisher = getattr(type(self), '_eq_finisher', lambda x : x)
-        return eq_finisher(self.values) < eq_finisher(other.values)
+        values, other_values = self._comparable_values(other)
+        return values < other_values
 
     def __gt__(self: AbstractSequence[T], other: AbstractSequence[T]) -> bool:
         """
@@ -100,8 +120,8 @@ class AbstractSequence[T](Collection[T]):
         """
         if not isinstance(other, AbstractSequence):
             return NotImplemented
-        eq_finisher = getattr(type(self), '_eq_finisher', lambda x : x)
-        return eq_finisher(self.values) > eq_finisher(other.values)
+        values, other_values = self._comparable_values(other)
+        return values > other_values
 
     def __le__(self: AbstractSequence[T], other: AbstractSequence[T]) -> bool:
         """
@@ -115,8 +135,8 @@ class AbstractSequence[T](Collection[T]):
         """
         if not isinstance(other, AbstractSequence):
             return NotImplemented
-        eq_finisher = getattr(type(self), '_eq_finisher', lambda x : x)
-        return eq_finisher(self.values) <= eq_finisher(other.values)
+        values, other_values = self._comparable_values(other)
+        return values <= other_values
 
     def __ge__(self: AbstractSequence[T], other: AbstractSequence[T]) -> bool:
         """
@@ -130,8 +150,8 @@ class AbstractSequence[T](Collection[T]):
         """
         if not isinstance(other, AbstractSequence):
             return NotImplemented
-        eq_finisher = getattr(type(self), '_eq_finisher', lambda x : x)
-        return eq_finisher(self.values) >= eq_finisher(other.values)
+        values, other_values = self._comparable_values(other)
+        return values >= other_values
 
     def __add__[S: AbstractSequence](
         self: S,
@@ -162,7 +182,7 @@ class AbstractSequence[T](Collection[T]):
             new_item_type = self.item_type
 
         finisher = getattr(new_sequence_type, '_finisher', list)
-        return new_sequence_type[new_item_type](finisher(self.values) + finisher(other.values), _skip_validation=True)
+        return new_sequence_type[new_item_type]._unchecked(finisher(self.values) + finisher(other.values), _copy=False)
 
     def __mul__[S: AbstractSequence](
         self: S,
@@ -181,7 +201,7 @@ class AbstractSequence[T](Collection[T]):
         """
         if not isinstance(n, int):
             return NotImplemented
-        return type(self)(self.values * n, _skip_validation=True)
+        return type(self)._unchecked(self.values * n, _copy=False)
 
     def __rmul__[S: AbstractSequence](
         self: S,
@@ -200,7 +220,7 @@ class AbstractSequence[T](Collection[T]):
         """
         if not isinstance(n, int):
             return NotImplemented
-        return type(self)(self.values * n, _skip_validation=True)
+        return type(self)._unchecked(self.values * n, _copy=False)
 
     def __reversed__(self: AbstractSequence[T]) -> Iterator[T]:
         """
@@ -219,7 +239,7 @@ class AbstractSequence[T](Collection[T]):
          reversed order.
         :rtype: S
         """
-        return type(self)(reversed(self.values), _skip_validation=True)
+        return type(self)._unchecked(reversed(self.values), _copy=False)
 
     def index(self: AbstractSequence[T], value: T) -> int:
         """
@@ -262,6 +282,9 @@ class AbstractSequence[T](Collection[T]):
         """
         Returns a new AbstractSequence with its elements sorted by an optional key.
 
+        Delegates to the built-in sorted function, passing the key unmodified, so that when no key is given the values
+        are compared directly by Timsort and no key wrapper is involved. Validation is skipped for the sorted values.
+
         :param key: Optional function to extract the comparison key from.
         :type key: Callable[[T], Any] | None
 
@@ -272,7 +295,7 @@ class AbstractSequence[T](Collection[T]):
          according to the key and reverse parameters.
         :rtype: S
         """
-        return type(self)(sorted(self.values, key=key, reverse=reverse), _skip_validation=True)
+        return type(self)._unchecked(sorted(self.values, key=key, reverse=reverse), _copy=False)
 
 
 @forbid_instantiation
@@ -301,6 +324,8 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         _mutable (ClassVar[bool]): Metadata attribute describing the mutability of this class.
     """
 
+    __slots__ = ()
+
     item_type: type[T]
     values: list[T]
 
@@ -325,8 +350,7 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         :param _coerce: State parameter that, if True, attempts to coerce the value into the expected type.
         :type _coerce: bool
         """
-        from type_validation.type_validation import _validate_or_coerce_value
-        self.values.append(_validate_or_coerce_value(value, self.item_type, _coerce=_coerce))
+        self.values.append(_type_validation()._validate_or_coerce_value(value, self.item_type, _coerce=_coerce))
 
     def __setitem__(
         self: AbstractMutableSequence[T],
@@ -349,16 +373,14 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
 
         :raises TypeError: If index is not int or slice.
         """
-        from type_validation.type_validation import _validate_or_coerce_iterable, _validate_or_coerce_value
+        if isinstance(index, int):
+            self.values[index] = _type_validation()._validate_or_coerce_value(value, self.item_type, _coerce=_coerce)
 
-        if isinstance(index, slice):
+        elif isinstance(index, slice):
             allowed_ordered_types = getattr(type(self), '_allowed_ordered_types', (AbstractSequence, list, tuple))
             if not isinstance(value, allowed_ordered_types):
                 raise ValueError(f"Values of type {class_name(type(value))} attempted to be assigned to a slice.")
-            self.values[index] = _validate_or_coerce_iterable(value, self.item_type, _coerce=_coerce)
-
-        elif isinstance(index, int):
-            self.values[index] = _validate_or_coerce_value(value, self.item_type, _coerce=_coerce)
+            self.values[index] = _type_validation()._validate_or_coerce_iterable(value, self.item_type, _coerce=_coerce)
 
     def __delitem__(self: AbstractMutableSequence[T], index: int | slice) -> None:
         """
@@ -390,7 +412,7 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         if self.item_type != other.item_type:
             from type_validation.type_hierarchy import _is_subtype
             if not _is_subtype(other.item_type, self.item_type):
-                raise TypeError(f"Incompatible types between {class_name(self)} and {class_name(other)}.")
+                raise TypeError(f"Incompatible types between {class_name(type(self))} and {class_name(type(other))}.")
 
         self.values.extend(other.values)
         return self
@@ -410,7 +432,8 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         if not isinstance(n, int):
             return NotImplemented
 
-        self.values[:] = self.values * n
+        values = self.values
+        values *= n  # Repeats the underlying list in place, without building a new one
         return self
 
     def sort(
@@ -421,6 +444,9 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         """
         Sorts the sequence in place according to an optional key.
 
+        Delegates to the underlying list's sort method, passing the key unmodified, so that when no key is given the
+        values are compared directly by Timsort and no key wrapper is involved.
+
         :param key: Optional function to extract comparison key from elements.
         :type key: Callable[[T], Any] | None
 
@@ -454,8 +480,7 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         :param _coerce: State parameter that, if True, attempts to coerce the value into the expected type.
         :type _coerce: bool
         """
-        from type_validation.type_validation import _validate_or_coerce_value
-        self.values.insert(index, _validate_or_coerce_value(value, self.item_type, _coerce=_coerce))
+        self.values.insert(index, _type_validation()._validate_or_coerce_value(value, self.item_type, _coerce=_coerce))
 
     def extend(
         self: AbstractMutableSequence[T],
@@ -472,8 +497,7 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         :param _coerce: If True, attempts to coerce each value into the expected type.
         :type _coerce: bool
         """
-        from type_validation.type_validation import _validate_or_coerce_iterable
-        self.values.extend(_validate_or_coerce_iterable(other, self.item_type, _coerce=_coerce))
+        self.values.extend(_type_validation()._validate_or_coerce_iterable(other, self.item_type, _coerce=_coerce))
 
     def pop(self: AbstractMutableSequence[T], index: int = -1) -> T:
         """
@@ -499,6 +523,27 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         """
         self.values[:] = [item for item in self.values if predicate(item)]
 
+    def map_inplace(
+        self: AbstractMutableSequence[T],
+        f: Callable[[T], T],
+        *,
+        _coerce: bool = False
+    ) -> None:
+        """
+        Maps each value in this sequence to their image by the function f, preserving their order.
+
+        Overrides the method from the parent class MutableCollection, which goes through replace_many with a dict of the
+        images, so here the images are mapped in a single pass and validated all at once, and the values don't need to
+        be hashable.
+
+        :param f: Mapping to apply to the sequence.
+        :type f: Callable[[T], T]
+
+        :param _coerce: State parameter that, if True, attempts to coerce the new values to the sequence's item type.
+        :type _coerce: bool
+        """
+        self.values[:] = _type_validation()._validate_or_coerce_iterable(map(f, self.values), self.item_type, _coerce=_coerce)
+
     def replace(
         self: AbstractMutableSequence[T],
         old: T,
@@ -518,8 +563,7 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         :param _coerce: State parameter that, if True, attempts to coerce the new value to the sequence's item type.
         :type _coerce: bool
         """
-        from type_validation.type_validation import _validate_or_coerce_value
-        new = _validate_or_coerce_value(new, self.item_type, _coerce=_coerce)
+        new = _type_validation()._validate_or_coerce_value(new, self.item_type, _coerce=_coerce)
         self.values[:] = [new if item == old else item for item in self.values]
 
     def replace_many(
@@ -537,6 +581,7 @@ class AbstractMutableSequence[T](AbstractSequence[T], MutableCollection[T]):
         :param _coerce: State parameter that, if True, attempts to coerce the new values to self's item type.
         :type _coerce: bool
         """
-        from type_validation.type_validation import _validate_or_coerce_value
-        validated_replacements = {old : _validate_or_coerce_value(new, self.item_type, _coerce=_coerce) for old, new in replacements.items()}
-        self.values[:] = [validated_replacements.get(item, item) for item in self.values]
+        validate_or_coerce_value = _type_validation()._validate_or_coerce_value
+        validated_replacements = {old : validate_or_coerce_value(new, self.item_type, _coerce=_coerce) for old, new in replacements.items()}
+        replacement_of = validated_replacements.get
+        self.values[:] = map(replacement_of, self.values, self.values)
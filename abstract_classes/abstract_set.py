@@ -38,6 +38,8 @@ class AbstractSet[T](Collection[T]):
          values on the eq method to check for equality.
     """
 
+    __slots__ = ()
+
     item_type: type[T]
     values: frozenset[T]
 
@@ -144,7 +146,7 @@ class AbstractSet[T](Collection[T]):
         else:
             new_item_type = self.item_type
 
-        return new_set_type[new_item_type](self.values | other.values, _skip_validation=True)
+        return new_set_type[new_item_type]._unchecked(self.values | other.values, _copy=False)
 
     def __and__[S: AbstractSet](self: S, other: S) -> S:
         """
@@ -168,7 +170,7 @@ class AbstractSet[T](Collection[T]):
         else:
             new_type = self.item_type
 
-        return set_type[new_type](self.values & other.values, _skip_validation=True)
+        return set_type[new_type]._unchecked(self.values & other.values, _copy=False)
 
     def __sub__[S: AbstractSet](self: S, other: Iterable) -> S:
         """
@@ -181,8 +183,10 @@ class AbstractSet[T](Collection[T]):
          in `other`.
         :rtype: S
         """
+        if isinstance(other, AbstractSet) and other.item_type == self.item_type:
+            return type(self)._unchecked(self.values - other.values, _copy=False)
         from type_validation.type_validation import _validate_or_coerce_iterable
-        return type(self)(self.values - _validate_or_coerce_iterable(other, self.item_type, _finisher=set), _skip_validation=True)
+        return type(self)._unchecked(self.values - _validate_or_coerce_iterable(other, self.item_type, _finisher=set), _copy=False)
 
     def __xor__[S: AbstractSet](self: S, other: S) -> S:
         """
@@ -206,7 +210,7 @@ class AbstractSet[T](Collection[T]):
         else:
             new_type = self.item_type
 
-        return set_type[new_type](self.values ^ other.values, _skip_validation=True)
+        return set_type[new_type]._unchecked(self.values ^ other.values, _copy=False)
 
     def union[S: AbstractSet](
         self: S,
@@ -230,7 +234,7 @@ class AbstractSet[T](Collection[T]):
         :rtype: S
         """
         from type_validation.type_validation import _validate_or_coerce_iterable_of_iterables
-        return type(self)(self.values.union(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce)), _skip_validation=True)
+        return type(self)._unchecked(self.values.union(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce, _inner_finisher=tuple)), _copy=False)
 
     def intersection[S: AbstractSet](
         self: S,
@@ -254,7 +258,7 @@ class AbstractSet[T](Collection[T]):
         :rtype: AbstractSet[T]
         """
         from type_validation.type_validation import _validate_or_coerce_iterable_of_iterables
-        return type(self)(self.values.intersection(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce)), _skip_validation=True)
+        return type(self)._unchecked(self.values.intersection(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce, _inner_finisher=tuple)), _copy=False)
 
     def difference[S: AbstractSet](
         self: S,
@@ -278,7 +282,7 @@ class AbstractSet[T](Collection[T]):
         :rtype: S
         """
         from type_validation.type_validation import _validate_or_coerce_iterable_of_iterables
-        return type(self)(self.values.difference(*_validate_or_coerce_iterable_of_iterables(others, self.item_type,_coerce=_coerce)), _skip_validation=True)
+        return type(self)._unchecked(self.values.difference(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce, _inner_finisher=tuple)), _copy=False)
 
     def symmetric_difference[S: AbstractSet](
         self: S,
@@ -302,7 +306,7 @@ class AbstractSet[T](Collection[T]):
         new_values = self.values
         for validated_set in _validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce):
             new_values = new_values.symmetric_difference(validated_set)
-        return type(self)(new_values, _skip_validation=True)
+        return type(self)._unchecked(new_values, _copy=new_values is self.values)
 
     def is_subset(
         self: AbstractSet,
@@ -392,6 +396,8 @@ class AbstractMutableSet[T](AbstractSet[T], MutableCollection[T]):
         _mutable (ClassVar[bool]): Metadata attribute describing the mutability of this class.
     """
 
+    __slots__ = ()
+
     item_type: type[T]
     values: set[T]
 
@@ -564,7 +570,7 @@ class AbstractMutableSet[T](AbstractSet[T], MutableCollection[T]):
         :type _coerce: bool
         """
         from type_validation.type_validation import _validate_or_coerce_iterable_of_iterables
-        self.values.update(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce))
+        self.values.update(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce, _inner_finisher=tuple))
 
     def difference_update(
         self: AbstractMutableSet[T],
@@ -581,7 +587,7 @@ class AbstractMutableSet[T](AbstractSet[T], MutableCollection[T]):
         :type _coerce: bool
         """
         from type_validation.type_validation import _validate_or_coerce_iterable_of_iterables
-        self.values.difference_update(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce))
+        self.values.difference_update(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce, _inner_finisher=tuple))
 
     def intersection_update(
         self: AbstractMutableSet[T],
@@ -598,7 +604,7 @@ class AbstractMutableSet[T](AbstractSet[T], MutableCollection[T]):
         :type _coerce: bool
         """
         from type_validation.type_validation import _validate_or_coerce_iterable_of_iterables
-        self.values.intersection_update(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce))
+        self.values.intersection_update(*_validate_or_coerce_iterable_of_iterables(others, self.item_type, _coerce=_coerce, _inner_finisher=tuple))
 
     def symmetric_difference_update(
         self: AbstractMutableSet[T],
@@ -1,13 +1,59 @@
 from __future__ import annotations
 
 from functools import reduce
-from typing import Iterable, Any, Callable, TypeVar, ClassVar, Iterator
-from collections import defaultdict
+from itertools import chain
+from math import prod
+from operator import add, mul, countOf
+from types import ModuleType
+from typing import Any, Callable, TypeVar, ClassVar, Iterator, TYPE_CHECKING
+from collections import defaultdict, deque
+from collections.abc import Iterable
 
-from abstract_classes.generic_base import GenericBase, class_name, forbid_instantiation, _convert_to
+from abstract_classes.generic_base import GenericBase, class_name, forbid_instantiation, _convert_to, _has_frozen_repr, _object_setattr
+
+if TYPE_CHECKING:
+    from concrete_classes.stream import Stream
 
 _MISSING = object()
 
+# Built-in C reductions that are exact and keep the order of the operations when applied to ints.
+_INT_REDUCTIONS: dict[Callable[[int, int], int], Callable[..., int]] = {add: sum, mul: prod}
+
+# Exact built-in classes known to be non-str iterables, checked before the much slower isinstance against the ABC.
+_ITERABLE_CLASSES: frozenset[type] = frozenset({list, tuple, set, frozenset, dict, range})
+
+
+def _is_non_str_iterable(obj: Any) -> bool:
+    """
+    Checks if an object is an Iterable other than a str or bytes, trying a lookup of its exact class first.
+
+    :param obj: Object to check.
+    :type obj: Any
+
+    :return: True if obj is an Iterable but not a str or bytes, False otherwise.
+    :rtype: bool
+    """
+    return type(obj) in _ITERABLE_CLASSES or (isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)))
+
+
+# The type_validation module imports this one, so it can't be imported at module level. It's bound on the first call
+# of _type_validation instead, sparing later calls from going through the import machinery.
+_type_validation_module: ModuleType | None = None
+
+
+def _type_validation() -> ModuleType:
+    """
+    Gets the type_validation.type_validation module, importing it only the first time it's needed.
+
+    :return: The type_validation.type_validation module.
+    :rtype: ModuleType
+    """
+    global _type_validation_module
+    if _type_validation_module is None:
+        import type_validation.type_validation as module
+        _type_validation_module = module
+    return _type_validation_module
+
 
 @forbid_instantiation
 class Collection[T](GenericBase):
@@ -45,11 +91,28 @@ class Collection[T](GenericBase):
         item_type (type[T]): The type of elements stored in the collection, derived from the generic type.
 
         values (Iterable[T]): The internal container of stored values, usually of one of Python's built-in Iterables.
+
+        _finisher (ClassVar[Callable[[Iterable], Iterable]]): Default of the _finisher parameter of init, resolved on
+         the class instead of on each call. Defaults to the identity, and is overridden by the subclasses to build their
+         underlying container.
+
+        _skip_validation_finisher (ClassVar[Callable[[Iterable], Iterable]]): Applied to the values instead of
+         _finisher when init is called with _skip_validation=True. Defaults to the identity.
+
+        _forbidden_iterable_types (ClassVar[tuple[type, ...]]): Default of the _forbidden_iterable_types parameter of
+         init. Defaults to an empty tuple.
     """
 
+    __slots__ = ()
+
     item_type: type[T]
     values: Iterable[T]
 
+    # Metadata class attributes
+    _finisher: ClassVar[Callable[[Iterable], Iterable]] = lambda x : x
+    _skip_validation_finisher: ClassVar[Callable[[Iterable], Iterable]] = lambda x : x
+    _forbidden_iterable_types: ClassVar[tuple[type, ...]] = ()
+
     def __init__(
         self: Collection[T],
         *values: T | Iterable[T],
@@ -74,7 +137,7 @@ class Collection[T](GenericBase):
         :type _forbidden_iterable_types: tuple[type, ...]
 
         :param _finisher: Callable to be applied to the values before storing them on the values attribute of the object.
-         Defaults to None, and in that case is later assigned to the identity mapping.
+         Defaults to None, and in that case the _finisher class attribute is used.
         :type _finisher: Callable[[Iterable[T]], Any]
 
         :param _skip_validation: State parameter to skip type validation of the values. Only use it in cases where it's
@@ -84,8 +147,6 @@ class Collection[T](GenericBase):
         :raises TypeError: If the generic type wasn't provided or was a TypeVar, or if the values iterable parameter is
          of one of the forbidden iterable types.
         """
-        from type_validation.type_validation import _validate_or_coerce_iterable, _validate_type
-
         # The generic type of the Collection is fetched from its _args attribute inherited from GenericBase.
         generic_item_type: type = type(self)._inferred_item_type()
 
@@ -97,25 +158,56 @@ class Collection[T](GenericBase):
 
         if (
             len(values) == 1 # If the values are a length 1 tuple
-            and not _validate_type(values[0], generic_item_type) # Whose only element doesn't validate the expected type
-            and isinstance(values[0], Iterable) # While that element being an Iterable
-            and not isinstance(values[0], (str, bytes)) # But not a str or bytes iterable
+            and _is_non_str_iterable(values[0]) # Whose only element is an Iterable, but not a str or bytes
+            and not _type_validation()._validate_type(values[0], generic_item_type) # While that element doesn't validate the expected type
         ):
             values = values[0]  # Then, the values are unpacked.
 
-        forbidden_iterable_types = _forbidden_iterable_types or getattr(type(self), '_forbidden_iterable_types', ())
+        cls = type(self)
 
-        if isinstance(values, forbidden_iterable_types):
-            raise TypeError(f"Invalid values type: {class_name(type(values))} for class {class_name(type(self))}.")
+        if isinstance(values, _forbidden_iterable_types or cls._forbidden_iterable_types):
+            raise TypeError(f"Invalid values type: {class_name(type(values))} for class {class_name(cls)}.")
 
-        object.__setattr__(self, 'item_type', generic_item_type)
+        _object_setattr(self, 'item_type', generic_item_type)
 
-        finisher = _finisher or getattr(type(self), '_finisher', lambda x : x)
-        skip_validation_finisher = getattr(type(self), '_skip_validation_finisher', None) or finisher
+        # The finishers are class attributes, resolved once when the class is defined, so they're just read from it.
+        if _skip_validation:
+            final_values = cls._skip_validation_finisher(values)
+        else:
+            final_values = _type_validation()._validate_or_coerce_iterable(values, generic_item_type, _coerce=_coerce, _finisher=_finisher or cls._finisher)
 
-        final_values = skip_validation_finisher(values) if _skip_validation else _validate_or_coerce_iterable(values, self.item_type, _coerce=_coerce, _finisher=finisher)
+        _object_setattr(self, 'values', final_values)
 
-        object.__setattr__(self, 'values', final_values)
+    @classmethod
+    def _unchecked[C: Collection](cls: type[C], values: Iterable[T], *, _copy: bool = True) -> C:
+        """
+        Creates an object of this Collection subclass with the given values, bypassing all the checks of __init__.
+
+        The values are only passed through the class' _skip_validation_finisher, exactly like __init__ would do if
+        called with _skip_validation=True, but without inferring the item type, unpacking the values or checking them
+        against the forbidden iterable types. The _repr_cache and _hash_cache slots of the classes declaring them are
+        cleared. Only meant for internal use when the class is known to be called upon a generic type and the values are
+        known to be a single Iterable matching it.
+
+        :param values: Iterable of the values to store.
+        :type values: Iterable[T]
+
+        :param _copy: State parameter that, if False, passes the values through the class' _finisher instead, which
+         stores them as they are if they're already in the class' container. Only use it when the values are a new
+         container not shared with any other object.
+        :type _copy: bool
+
+        :return: A new object of the class containing the values.
+        :rtype: C
+        """
+        obj = cls.__new__(cls)
+        _object_setattr(obj, 'item_type', cls._args[0])
+        _object_setattr(obj, 'values', cls._skip_validation_finisher(values) if _copy else cls._finisher(values))
+        if hasattr(cls, '_repr_cache'):
+            _object_setattr(obj, '_repr_cache', None)
+        if hasattr(cls, '_hash_cache'):
+            _object_setattr(obj, '_hash_cache', None)
+        return obj
 
     @classmethod
     def _inferred_item_type(cls: type[Collection[T]]) -> type[T] | None:
@@ -155,7 +247,7 @@ class Collection[T](GenericBase):
         if hasattr(cls, '_args'):
             from type_validation.type_hierarchy import _is_subtype
             if not _is_subtype(inferred_generic_type, cls._inferred_item_type()):
-                raise TypeError(f"Tried applying .of_values method to with a parametrized class but the inferred type {class_name(inferred_generic_type)} isn't a subtype of {class_name(cls._args)}")
+                raise TypeError(f"Tried applying .of_values method to with a parametrized class but the inferred type {class_name(inferred_generic_type)} isn't a subtype of {class_name(cls._inferred_item_type())}")
             return cls(values, _skip_validation=True)
         return cls[inferred_generic_type](values, _skip_validation=True)
 
@@ -178,7 +270,7 @@ class Collection[T](GenericBase):
         if hasattr(cls, '_args'):
             from type_validation.type_hierarchy import _is_subtype
             if not _is_subtype(inferred_generic_type, cls._inferred_item_type()):
-                raise TypeError(f"Tried applying .of_values method to with a parametrized class but the inferred type {class_name(inferred_generic_type)} isn't a subtype of {class_name(cls._args)}")
+                raise TypeError(f"Tried applying .of_iterable method to with a parametrized class but the inferred type {class_name(inferred_generic_type)} isn't a subtype of {class_name(cls._inferred_item_type())}")
             return cls(values, _skip_validation=True)
         return cls[inferred_generic_type](values, _skip_validation=True)
 
@@ -217,41 +309,77 @@ class Collection[T](GenericBase):
         """
         return iter(self.values)
 
-    def __contains__(self: Collection[T], item: T) -> bool:
+    def __contains__(self: Collection[T], item: T | Iterable[T]) -> bool:
         """
-        Returns True if the provided item is contained in the Collection's internal container.
+        Returns True if the provided item, or all the items of the provided iterable, are contained in the Collection.
+
+        If the item is a list, tuple, set, frozenset or Collection that isn't itself of the Collection's item type, the
+        containment of all of its elements is checked at once with set.issuperset, falling back to checking them one by
+        one if any of them isn't hashable.
 
-        :return: True if the item is contained in the collection's values. False otherwise.
+        :param item: Item or iterable of items to check the containment of.
+        :type item: T | Iterable[T]
+
+        :return: True if the item, or every item of the iterable, is contained in the collection's values. False
+         otherwise.
         :rtype: bool
         """
+        if isinstance(item, (list, tuple, set, frozenset, Collection)):
+            if not _type_validation()._validate_type(item, self.item_type):
+                try:
+                    values = self.values if isinstance(self.values, (set, frozenset)) else set(self.values)
+                    return values.issuperset(item)
+                except TypeError:
+                    return all(map(self.values.__contains__, item))
         return item in self.values
 
     def __eq__(self, other) -> bool:
         """
         Checks if two Collections are equal comparing their values and item type.
 
+        A Collection is always equal to itself, and Collections with a different number of values are never equal. If
+        both underlying containers are of the same class, they are compared directly, without applying _eq_finisher,
+        and if both Collections are of the same class, their item types are known to match without comparing them.
+
         :return: True if other is of a comparable class to self's class, has the same item_type and the same values
          after applying the class's _eq_finisher callable attribute to them.
         :rtype: bool
         """
-        eq_finisher: Callable[[Iterable], Iterable] = getattr(type(self), '_eq_finisher', lambda x : x)
+        if self is other:
+            return True
+        if type(self) is type(other):
+            return self.values == other.values
         comparable_types: type[Collection] | tuple[type[Collection], ...] = getattr(type(self), '_comparable_types', Collection)
-        return (
-            isinstance(other, comparable_types)
-            and self.item_type == other.item_type
-            and eq_finisher(self.values) == eq_finisher(other.values)
-        )
+        if (
+            not isinstance(other, comparable_types)
+            or self.item_type != other.item_type
+            or len(self.values) != len(other.values)
+        ):
+            return False
+        if type(self.values) is type(other.values):
+            return self.values == other.values
+        eq_finisher: Callable[[Iterable], Iterable] = getattr(type(self), '_eq_finisher', lambda x : x)
+        return eq_finisher(self.values) == eq_finisher(other.values)
 
     def __repr__(self) -> str:
         """
         Returns a string representation of the Collection, showing its generic type name and contained values.
 
+        Immutable classes declaring a _repr_cache slot store their representation on it the first time it's computed,
+        as long as the repr of their items can't change either.
+
         :return: A string representation of the object, applying the _repr_finisher callable attribute of the class
          to the values before showing them.
         :rtype: str
         """
+        cached_repr = getattr(self, '_repr_cache', None)
+        if cached_repr is not None:
+            return cached_repr
         repr_finisher: Callable[[Iterable], Iterable] = getattr(type(self), '_repr_finisher', lambda x : x)
-        return f"{class_name(type(self))}{repr_finisher(self.values)}"
+        result = f"{class_name(type(self))}{repr_finisher(self.values)}"
+        if _has_frozen_repr(type(self)):
+            _object_setattr(self, '_repr_cache', result)
+        return result
 
     def __bool__(self) -> bool:
         """
@@ -269,6 +397,9 @@ class Collection[T](GenericBase):
         If the underlying values implement `.copy()`, it uses that method. Otherwise, directly references the original
         values or uses `deepcopy` if requested. Skips re-validation for performance.
 
+        A shallow copy of an immutable Collection is the Collection itself, just like it happens with tuple and frozenset,
+        since its underlying container can never change.
+
         :param deep: Boolean state parameter to control if the copy is shallow or deep.
         :type deep: bool
 
@@ -278,9 +409,11 @@ class Collection[T](GenericBase):
         if deep:
             from copy import deepcopy
             copied_values = deepcopy(self.values)
+        elif not getattr(type(self), '_mutable', False):
+            return self
         else:
             copied_values = self.values.copy() if hasattr(self.values, 'copy') else self.values
-        return type(self)(copied_values, _skip_validation=True)
+        return type(self)._unchecked(copied_values, _copy=copied_values is self.values)
 
     def to_list(self: Collection[T]) -> list[T]:
         """
@@ -336,10 +469,7 @@ class Collection[T](GenericBase):
          key_mapper and value_mapper callables.
         :rtype: dict[K, V]
         """
-        return {
-            key_mapper(item) : value_mapper(item)
-            for item in self
-        }
+        return dict(zip(map(key_mapper, self.values), map(value_mapper, self.values)))
 
     def count(self: Collection[T], value: T) -> int:
         """
@@ -349,13 +479,16 @@ class Collection[T](GenericBase):
         :type value: T
 
         :return: The number of appearances of the value in the Collection. If the underlying container supports
-         .count, it uses that method; otherwise, falls back to manual equality counting.
+         .count, it uses that method. If it's a set, its hashed membership check is used, as it holds each value at most
+         once. Otherwise, falls back to equality counting with operator.countOf.
         :rtype: int
         """
         try:
+            if isinstance(self.values, (set, frozenset)):
+                return int(value in self.values)
             return self.values.count(value)
         except (AttributeError, TypeError, ValueError):
-            return sum(1 for v in self.values if v == value)
+            return countOf(self.values, value)
 
     def find_any(self: Collection[T]) -> T:
         """
@@ -393,7 +526,7 @@ class Collection[T](GenericBase):
         :rtype: C
         """
         from abstract_classes.generic_base import base_class
-        mapped_values = [f(value) for value in self.values]
+        mapped_values = list(map(f, self.values))
         collection_subclass = base_class(self)
         return (
             collection_subclass[result_type](mapped_values, _coerce=_coerce)
@@ -401,6 +534,46 @@ class Collection[T](GenericBase):
             else collection_subclass.of_iterable(mapped_values)
         )
 
+    def filter_map[C: Collection](
+        self: C,
+        f: Callable[[T], Any],
+        predicate: Callable[[Any], bool],
+        result_type: type | None = None,
+        *,
+        _coerce: bool = False
+    ) -> C:
+        """
+        Maps each value of the Collection by the function `f` and keeps only the images satisfying the predicate.
+
+        Equivalent to .map(f, result_type).filter(predicate), but done in a single pass over the values, without
+        building nor validating the intermediate Collection of all the images.
+
+        :param f: Callable object to map the Collection with.
+        :type f: Callable[[T], Any]
+
+        :param predicate: A function from the images of `f` to the booleans.
+        :type predicate: Callable[[Any], bool]
+
+        :param result_type: Type expected to be returned by the Callable. If None, it will be inferred.
+        :type result_type: type | None
+
+        :param _coerce: State parameter that if True, tries to coerce results to the result_type if it's not None.
+        :type _coerce: bool
+
+        :return: A new Collection of the same subclass as self containing the images satisfying the predicate. If
+         result_type is given, it is used as the item_type of the returned Collection, if not that is inferred from the
+         kept values.
+        :rtype: C
+        """
+        from abstract_classes.generic_base import base_class
+        kept_values = list(filter(predicate, map(f, self.values)))
+        collection_subclass = base_class(self)
+        return (
+            collection_subclass[result_type](kept_values, _coerce=_coerce)
+            if result_type is not None
+            else collection_subclass.of_iterable(kept_values)
+        )
+
     def flatmap[C: Collection](
         self: C,
         f: Callable[[T], Iterable],
@@ -427,12 +600,10 @@ class Collection[T](GenericBase):
         :rtype: C
         """
         from abstract_classes.generic_base import base_class
-        flattened = []
-        for value in self.values:
-            result = f(value)
-            if not isinstance(result, Iterable) or isinstance(result, (str, bytes)):
-                raise TypeError("flatmap function must return a non-string iterable")
-            flattened.extend(result)
+        results = list(map(f, self.values))
+        if not all(map(_is_non_str_iterable, results)):
+            raise TypeError("flatmap function must return a non-string iterable")
+        flattened = list(chain.from_iterable(results))
         collection_subclass = base_class(self)
         return (
             collection_subclass[result_type](flattened, _coerce=_coerce)
@@ -449,7 +620,7 @@ class Collection[T](GenericBase):
         :return: A filtered collection containing only the values that were evaluated to True by the predicate.
         :rtype: C
         """
-        return type(self)([value for value in self.values if predicate(value)], _skip_validation=True)
+        return type(self)._unchecked(list(filter(predicate, self.values)), _copy=False)
 
     def all_match(self: Collection[T], predicate: Callable[[T], bool]) -> bool:
         """
@@ -461,7 +632,7 @@ class Collection[T](GenericBase):
         :return: True if all elements match the predicate, False otherwise.
         :rtype: bool
         """
-        return all(predicate(value) for value in self.values)
+        return all(map(predicate, self.values))
 
     def any_match(self: Collection[T], predicate: Callable[[T], bool]) -> bool:
         """
@@ -473,7 +644,7 @@ class Collection[T](GenericBase):
         :return: True if at least one element matches the predicate, False otherwise.
         :rtype: bool
         """
-        return any(predicate(value) for value in self.values)
+        return any(map(predicate, self.values))
 
     def none_match(self: Collection[T], predicate: Callable[[T], bool]) -> bool:
         """
@@ -485,7 +656,7 @@ class Collection[T](GenericBase):
         :return: True if no elements match the predicate, False otherwise.
         :rtype: bool
         """
-        return not any(predicate(value) for value in self.values)
+        return not any(map(predicate, self.values))
 
     def reduce(self: Collection[T], f: Callable[[T, T], T], unit: T = _MISSING) -> T:
         """
@@ -498,20 +669,32 @@ class Collection[T](GenericBase):
         :type unit: T | None
 
         :return: The result of the reduction, as done after being delegated to functools's reduce() function applied to
-         the internal container.
+         the internal container. When reducing a Collection of ints by operator.add or operator.mul, it is delegated to
+         the built-in sum or math.prod functions instead, which are exact and perform the operations in the same order
+         for ints. Likewise, reducing by the built-in min or max is delegated to a single call to them for any type.
         :rtype: T
         """
-        from type_validation.type_validation import _validate_type
+        int_reduction = _INT_REDUCTIONS[f] if self.item_type is int and f in (add, mul) else None
+        order_reduction = f is min or f is max
 
         if unit is _MISSING:  # unit not passed
+            if int_reduction is not None and self.values:
+                values = iter(self.values)
+                return int_reduction(values, start=next(values))
+            if order_reduction and self.values:
+                return f(self.values)
             return reduce(f, self.values)
 
-        if not _validate_type(unit, self.item_type):
+        if not _type_validation()._validate_type(unit, self.item_type):
             raise TypeError(
-                f"The unit provided {unit} was of type {class_name(unit)} "
+                f"The unit provided {unit} was of type {class_name(type(unit))} "
                 f"instead of {class_name(self.item_type)}"
             )
 
+        if int_reduction is not None:
+            return int_reduction(self.values, start=unit)
+        if order_reduction:
+            return f(chain((unit,), self.values))
         return reduce(f, self.values, unit)
 
     def for_each(self: Collection[T], consumer: Callable[[T], None]) -> None:
@@ -521,8 +704,7 @@ class Collection[T](GenericBase):
         :param consumer: A function that takes an element of type T and returns None.
         :type consumer: Callable[[T], None]
         """
-        for value in self.values:
-            consumer(value)
+        deque(map(consumer, self.values), maxlen=0)  # Consumes the map in C, discarding the results
 
     def peek[C: Collection](self: C, consumer: Callable[[T], None]) -> C:
         """
@@ -534,8 +716,7 @@ class Collection[T](GenericBase):
         :return: The original collection (self).
         :rtype: C
         """
-        for item in self.values:
-            consumer(item)
+        deque(map(consumer, self.values), maxlen=0)
         return self
 
     def distinct[K, C: Collection](self: C, key: Callable[[T], K] = _MISSING) -> C:
@@ -550,33 +731,32 @@ class Collection[T](GenericBase):
         """
         if key is _MISSING:
             if isinstance(self.values, (set, frozenset)):
-                return type(self)(self.values, _skip_validation=True)
-            key = lambda x : x
+                return type(self)._unchecked(self.values)
+            # dict.fromkeys deduplicates the values preserving their order within a single pass in C.
+            try:
+                return type(self)._unchecked(list(dict.fromkeys(self.values)), _copy=False)
+            except TypeError:
+                key = lambda x : x
 
+        # The keys are computed only once, so the fallback below doesn't call key again on the values already seen.
+        keys = list(map(key, self.values))
+        first_value_of_key = {}
+        try:
+            # setdefault only stores the first value of each key, and the deque consumes the map in C.
+            deque(map(first_value_of_key.setdefault, keys, self.values), maxlen=0)
+            return type(self)._unchecked(list(first_value_of_key.values()), _copy=False)
+        except TypeError:
+            pass
+
+        # Some key is unhashable, so the keys seen are compared by equality instead.
         result = []
-        seen_hashable = set()
-        seen_unhashable = []
-        using_set = True
+        seen = []
+        for key_of_value, value in zip(keys, self.values):
+            if key_of_value not in seen:
+                seen.append(key_of_value)
+                result.append(value)
 
-        for value in self.values:
-            key_of_value = key(value)
-            if using_set:
-                try:
-                    if key_of_value not in seen_hashable:
-                        seen_hashable.add(key_of_value)
-                        result.append(value)
-                except TypeError:
-                    using_set = False
-                    seen_unhashable = [*seen_hashable]
-                    if key_of_value not in seen_unhashable:
-                        seen_unhashable.append(key_of_value)
-                        result.append(value)
-            else:
-                if key_of_value not in seen_unhashable:
-                    seen_unhashable.append(key_of_value)
-                    result.append(value)
-
-        return type(self)(result, _skip_validation=True)
+        return type(self)._unchecked(result, _copy=False)
 
     def max(
         self: Collection[T],
@@ -639,8 +819,9 @@ class Collection[T](GenericBase):
         groups: dict[K, list[T]] = defaultdict(list)
         for item in self.values:
             groups[key(item)].append(item)
+        collection_of = type(self)._unchecked
         return {
-            key : type(self)(group, _skip_validation=True)
+            key : collection_of(group, _copy=False)
             for key, group in groups.items()
         }
 
@@ -651,14 +832,38 @@ class Collection[T](GenericBase):
         """
         A specialized binary version of group_by grouping by a predicate to bool.
 
+        The items are accumulated on two plain lists instead of a dict of lists, and each of them is wrapped only once
+        at the end, skipping validation, since the items were already validated when they got into self.
+
         :param predicate: Function from the type of the collection to the booleans to partition by.
         :type predicate: Callable[[T], bool]
 
         :return: A dict whose True key is mapped to a Collection of the same dynamic subclass as self containing all
-         items in it that satisfied the predicate, likewise for False.
+         items in it that satisfied the predicate, likewise for False. Keys with no items mapped to them are omitted.
         :rtype: dict[bool, C]
         """
-        return self.group_by(predicate)
+        matching: list[T] = []
+        not_matching: list[T] = []
+        for item in self.values:
+            (matching if predicate(item) else not_matching).append(item)
+        return {
+            result : type(self)._unchecked(group, _copy=False)
+            for result, group in ((True, matching), (False, not_matching))
+            if group
+        }
+
+    def stream(self: Collection[T]) -> Stream[T]:
+        """
+        Returns a lazy Stream over the values of the Collection.
+
+        Chaining map, filter, flatmap or peek on the Stream doesn't build nor validate any intermediate Collection, and
+        all of them are performed in a single pass over the values when a terminal operation is called on it.
+
+        :return: A new Stream whose source is this Collection, with its same item type.
+        :rtype: Stream[T]
+        """
+        from concrete_classes.stream import Stream
+        return Stream(self)
 
     def collect[A, R](
         self: Collection[T],
@@ -820,6 +1025,8 @@ class MutableCollection[T](Collection):
         values (Iterable[T]): The internal container of stored values, usually of one of Python's built-in Iterables.
     """
 
+    __slots__ = ()
+
     item_type: type[T]
     values: Iterable[T]
 
@@ -838,11 +1045,10 @@ class MutableCollection[T](Collection):
         :param _coerce: State parameter that, if True, attempts to coerce the value before removing it.
         :type _coerce: bool
         """
-        from type_validation.type_validation import _validate_or_coerce_value
         value_to_remove = value
         if _coerce:
             try:
-                value_to_remove = _validate_or_coerce_value(value, self.item_type)
+                value_to_remove = _type_validation()._validate_or_coerce_value(value, self.item_type)
             except (TypeError, ValueError):
                 pass
         self.values.remove(value_to_remove)
@@ -919,4 +1125,4 @@ class MutableCollection[T](Collection):
         :param items: Iterable of items to keep.
         :type items: Iterable[T]
         """
-        self.filter_inplace(lambda x : x in items)
\ No newline at end of file
+        self.filter_inplace(lambda x : x in items)
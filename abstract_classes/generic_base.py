@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from types import UnionType
+from functools import lru_cache
+from types import UnionType, NoneType
 from typing import Any, get_args, get_origin, Union, ClassVar, Callable, TypeVar
 from weakref import WeakValueDictionary
 
@@ -35,6 +36,12 @@ GenericBase[*Ts]
 (*) := Concrete class implementations. Everything else should be impossible to directly instantiate.
 """
 
+# Origins of both spellings of a union, Union[int, str] and int | str.
+_UNION_ORIGINS: frozenset[Any] = frozenset({Union, UnionType})
+
+# Bypasses the frozen __setattr__ of the dataclasses when their attributes are set on construction, resolved only once.
+_object_setattr: Callable[[object, str, Any], None] = object.__setattr__
+
 
 def base_class[T: GenericBase](obj: T) -> type[T]:
     return getattr(type(obj), '_origin', type(obj))
@@ -47,19 +54,53 @@ def class_name(cls: type) -> str:
     :param cls: Class whose name will be represented.
     :return: If the type is a Union or UnionType, it's represented using the pipe operator |. If it's a class that
      extends GenericBase (it has an _args attribute), then it is assumed the class has already been properly formatted
-     within the __class_getitem__ method it inherited from GenericBase.
+     within the __class_getitem__ method it inherited from GenericBase. The representations of unions and generic
+     aliases are memoized on a bounded cache.
+    """
+
+    # Case 1: A class, either plain or extending GenericBase already initialized with generics, so already formatted
+    if isinstance(cls, type):
+        return cls.__name__
+
+    try:
+        return _alias_name(_ordered_key(cls), cls)
+    except TypeError:  # Aliases with unhashable arguments, like some Literals, can't be cached
+        return _alias_name.__wrapped__(None, cls)
+
+
+def _ordered_key(alias: Any) -> Any:
+    """
+    Builds a cache key for a type that, unlike the type itself, tells reordered unions apart.
+
+    :param alias: Type to build the key for.
+    :return: The type itself if it's a class, a (type, value) pair for other leaves such as Literal values, or the
+     origin of the type next to the keys of its arguments, in order.
+    """
+    if isinstance(alias, type):
+        return alias
+    args = get_args(alias)
+    if not args:
+        return type(alias), alias
+    return get_origin(alias), tuple(map(_ordered_key, args))
+
+
+@lru_cache(maxsize=1024)
+def _alias_name(key: Any, alias: Any) -> str:
+    """
+    Gives a str representation of a type that isn't a class, like a Union or a generic alias, recursively.
+
+    :param key: Key given by _ordered_key for the alias, only used to tell apart the cache entries of aliases that
+     compare equal, like int | str and str | int, but are spelled differently.
+    :param alias: Type whose name will be represented.
+    :return: The representation of the type, as described in class_name.
     """
 
     # Case 0: Handle Union[...] using | notation
-    origin = get_origin(cls)
-    args = get_args(cls)
-    if origin in (Union, UnionType):
+    origin = get_origin(alias)
+    args = get_args(alias)
+    if origin in _UNION_ORIGINS:
         return " | ".join(class_name(arg) for arg in args)
 
-    # Case 1: A class extending GenericBase already initialized with generics
-    if hasattr(cls, "_args") and issubclass(cls, GenericBase):
-        return cls.__name__  # It's already been formatted
-
     # Case 2: Built-in generics list[int], dict[str, int], etc.
     if origin:
         origin_name = getattr(origin, '__name__', repr(origin))
@@ -67,7 +108,7 @@ def class_name(cls: type) -> str:
         return f"{origin_name}[{args_str}]"
 
     # Fallback
-    return getattr(cls, '__name__', repr(cls))
+    return getattr(alias, '__name__', repr(alias))
 
 
 def forbid_instantiation(cls: type) -> type:
@@ -102,6 +143,27 @@ def _convert_to(tp: type) -> Callable[[Any], Any]:
     return lambda x : x if isinstance(x, tp) else tp(x)
 
 
+_ATOMIC_TYPES: tuple[type, ...] = (int, float, complex, bool, str, bytes, NoneType)
+
+
+def _has_frozen_repr(tp: type) -> bool:
+    """
+    Checks if the repr of the objects of a given type can never change once they're created.
+
+    :param tp: Type to check.
+    :type tp: type
+
+    :return: True if tp is one of the atomic immutable built-in types, a union of types with a frozen repr, or a class
+     caching its repr on a _repr_cache slot whose generic types all have a frozen repr too. False otherwise.
+    :rtype: bool
+    """
+    if get_origin(tp) in _UNION_ORIGINS:
+        return all(map(_has_frozen_repr, get_args(tp)))
+    if tp in _ATOMIC_TYPES:
+        return True
+    return hasattr(tp, '_repr_cache') and all(map(_has_frozen_repr, getattr(tp, '_args', ())))
+
+
 @forbid_instantiation
 class GenericBase:
     """
@@ -109,6 +171,10 @@ class GenericBase:
     received at their instantiation and storing them as a tuple in an _args attribute, as well as an _origin attribute
     pointing to the class the generics were applied upon.
 
+    Every class along the inheritance tree, as well as the dynamic subclasses created by __class_getitem__, declares
+    empty __slots__, so that the instances of the concrete dataclasses, which declare their fields as slots, don't
+    carry a per-instance __dict__.
+
     The attribute _generic_type_registry keeps a registry of all the instances of a class with certain generics that
     have already been created, so when a new one is called, it tries to retrieve it from the registry before committing
     the memory to creating a new subclass.
@@ -123,6 +189,8 @@ class GenericBase:
         _origin (ClassVar[type]): A class attribute storing the base class that was called upon one or more generic types.
     """
 
+    __slots__ = ()
+
     _generic_type_registry: ClassVar[WeakValueDictionary[tuple[type, tuple[type, ...]], type]] = WeakValueDictionary()
     _args: ClassVar[tuple[type, ...]]
     _origin: ClassVar[type]
@@ -141,21 +209,38 @@ class GenericBase:
         """
         if not isinstance(item, tuple):
             item = (item,)
+        return _generic_subclass(cls, item)
 
-        if any(isinstance(t, TypeVar) for t in item):
-            return cls
 
-        cache_key = (cls, item)
-        if cache_key in GenericBase._generic_type_registry:
-            return GenericBase._generic_type_registry[cache_key]
+@lru_cache(maxsize=1024)
+def _generic_subclass(cls: type, item: tuple[type, ...]) -> type:
+    """
+    Gets the subclass of cls called upon the generic arguments in item, as described in GenericBase.__class_getitem__.
 
-        subclass = type(
-            f"{cls.__name__}[{", ".join(class_name(arg) for arg in item)}]",
-            (cls,),
-            {}
-        )
+    The most recently used subclasses are kept on this lru_cache, sparing them from the slower lookup on the weak
+    registry, which still keeps track of every subclass that is alive.
 
-        subclass._args = item
-        subclass._origin = cls
-        GenericBase._generic_type_registry[cache_key] = subclass
+    :param cls: Class called upon the generic arguments.
+    :param item: Tuple of the generic arguments.
+    :return: The subclass of cls storing the generic arguments, or cls itself if any of them is a TypeVar.
+    """
+    # The registry is looked up first and only once, as it's the most common case, and the TypeVar check is only
+    # needed when the subclass wasn't created yet, since subclasses called upon TypeVars are never registered.
+    cache_key = (cls, item)
+    subclass = GenericBase._generic_type_registry.get(cache_key)
+    if subclass is not None:
         return subclass
+
+    if any(isinstance(t, TypeVar) for t in item):
+        return cls
+
+    subclass = type(
+        f"{cls.__name__}[{", ".join(class_name(arg) for arg in item)}]",
+        (cls,),
+        {'__slots__': ()}
+    )
+
+    subclass._args = item
+    subclass._origin = cls
+    GenericBase._generic_type_registry[cache_key] = subclass
+    return subclass
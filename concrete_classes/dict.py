@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Mapping, Iterable, TYPE_CHECKING
 
 from immutabledict import immutabledict
 
 from abstract_classes.abstract_dict import AbstractMutableDict, AbstractDict
+from abstract_classes.generic_base import _object_setattr
 
 if TYPE_CHECKING:
     from concrete_classes.list import MutableList, ImmutableList
@@ -51,11 +52,12 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         """
         Returns a MutableList containing all keys in the dictionary.
 
-        :return: A MutableList of keys.
+        :return: A new MutableList object with the key type as its item type containing all the keys. Validation is
+         skipped when creating this object.
         :rtype: MutableList[K]
         """
         from concrete_classes.list import MutableList
-        return MutableList[self.key_type](self.keys())
+        return MutableList[self.key_type]._unchecked(self.keys())
 
     def keys_as_immutable_list(self: MutableDict[K, V]) -> ImmutableList[K]:
         """
@@ -66,7 +68,7 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         :rtype: ImmutableList[K]
         """
         from concrete_classes.list import ImmutableList
-        return ImmutableList[self.key_type](self.keys(), _skip_validation=True)
+        return ImmutableList[self.key_type]._unchecked(self.keys())
 
     def keys_as_mutable_set(self: MutableDict[K, V]) -> MutableSet[K]:
         """
@@ -77,7 +79,7 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         :rtype: MutableSet[K]
         """
         from concrete_classes.set import MutableSet
-        return MutableSet[self.key_type](self.keys(), _skip_validation=True)
+        return MutableSet[self.key_type]._unchecked(self.keys())
 
     def keys_as_immutable_set(self: MutableDict[K, V]) -> ImmutableSet[K]:
         """
@@ -88,7 +90,7 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         :rtype: ImmutableSet[K]
         """
         from concrete_classes.set import ImmutableSet
-        return ImmutableSet[self.key_type](self.keys(), _skip_validation=True)
+        return ImmutableSet[self.key_type]._unchecked(self.keys())
 
     def values_as_mutable_list(self: MutableDict[K, V]) -> MutableList[V]:
         """
@@ -99,7 +101,7 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         :rtype: MutableList[V]
         """
         from concrete_classes.list import MutableList
-        return MutableList[self.value_type](self.values(), _skip_validation=True)
+        return MutableList[self.value_type]._unchecked(self.values())
 
     def values_as_immutable_list(self: MutableDict[K, V]) -> ImmutableList[V]:
         """
@@ -110,7 +112,7 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         :rtype: ImmutableList[V]
         """
         from concrete_classes.list import ImmutableList
-        return ImmutableList[self.value_type](self.values(), _skip_validation=True)
+        return ImmutableList[self.value_type]._unchecked(self.values())
 
     def values_as_mutable_set(self: MutableDict[K, V]) -> MutableSet[V]:
         """
@@ -121,7 +123,7 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         :rtype: MutableSet[V]
         """
         from concrete_classes.set import MutableSet
-        return MutableSet[self.value_type](self.values(), _skip_validation=True)
+        return MutableSet[self.value_type]._unchecked(self.values())
 
     def values_as_immutable_set(self: MutableDict[K, V]) -> ImmutableSet[V]:
         """
@@ -132,7 +134,7 @@ class MutableDict[K, V](AbstractMutableDict[K, V]):
         :rtype: ImmutableSet[V]
         """
         from concrete_classes.set import ImmutableSet
-        return ImmutableSet[self.value_type](self.values(), _skip_validation=True)
+        return ImmutableSet[self.value_type]._unchecked(self.values())
 
 
 @dataclass(frozen=True, slots=True, repr=False, eq=False)
@@ -142,11 +144,14 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
 
     It adds some basic methods to transform the dict, its keys or values into other classes created in this file:
     MutableList, ImmutableList, MutableSet, ImmutableSet and MutableDict.
+
+    Its repr is computed lazily and stored on the _repr_cache slot, as long as the repr of its contents can't change.
     """
 
     key_type: type[K]
     value_type: type[V]
     data: immutabledict[K, V]
+    _repr_cache: str | None = field(init=False, repr=False, compare=False)
 
     def __init__(
         self: ImmutableDict[K, V],
@@ -159,6 +164,7 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         _skip_validation: bool = False
     ) -> None:
         AbstractDict.__init__(self, keys_values, _coerce_keys=_coerce_keys, _coerce_values=_coerce_values, _keys=_keys, _values=_values, _skip_validation=_skip_validation)
+        _object_setattr(self, '_repr_cache', None)
 
     def to_mutable_dict(self: ImmutableDict[K, V]) -> MutableDict[K, V]:
         """
@@ -174,11 +180,12 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         """
         Returns a MutableList containing all keys in the dictionary.
 
-        :return: A MutableList of keys.
+        :return: A new MutableList object with the key type as its item type containing all the keys. Validation is
+         skipped when creating this object.
         :rtype: MutableList[K]
         """
         from concrete_classes.list import MutableList
-        return MutableList[self.key_type](self.keys())
+        return MutableList[self.key_type]._unchecked(self.keys())
 
     def keys_as_immutable_list(self: ImmutableDict[K, V]) -> ImmutableList[K]:
         """
@@ -189,7 +196,7 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         :rtype: ImmutableList[K]
         """
         from concrete_classes.list import ImmutableList
-        return ImmutableList[self.key_type](self.keys(), _skip_validation=True)
+        return ImmutableList[self.key_type]._unchecked(self.keys())
 
     def keys_as_mutable_set(self: ImmutableDict[K, V]) -> MutableSet[K]:
         """
@@ -200,7 +207,7 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         :rtype: MutableSet[K]
         """
         from concrete_classes.set import MutableSet
-        return MutableSet[self.key_type](self.keys(), _skip_validation=True)
+        return MutableSet[self.key_type]._unchecked(self.keys())
 
     def keys_as_immutable_set(self: ImmutableDict[K, V]) -> ImmutableSet[K]:
         """
@@ -211,7 +218,7 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         :rtype: ImmutableSet[K]
         """
         from concrete_classes.set import ImmutableSet
-        return ImmutableSet[self.key_type](self.keys(), _skip_validation=True)
+        return ImmutableSet[self.key_type]._unchecked(self.keys())
 
     def values_as_mutable_list(self: ImmutableDict[K, V]) -> MutableList[V]:
         """
@@ -222,7 +229,7 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         :rtype: MutableList[V]
         """
         from concrete_classes.list import MutableList
-        return MutableList[self.value_type](self.values(), _skip_validation=True)
+        return MutableList[self.value_type]._unchecked(self.values())
 
     def values_as_immutable_list(self: ImmutableDict[K, V]) -> ImmutableList[V]:
         """
@@ -233,7 +240,7 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         :rtype: ImmutableList[V]
         """
         from concrete_classes.list import ImmutableList
-        return ImmutableList[self.value_type](self.values(), _skip_validation=True)
+        return ImmutableList[self.value_type]._unchecked(self.values())
 
     def values_as_mutable_set(self: ImmutableDict[K, V]) -> MutableSet[V]:
         """
@@ -244,7 +251,7 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         :rtype: MutableSet[V]
         """
         from concrete_classes.set import MutableSet
-        return MutableSet[self.value_type](self.values(), _skip_validation=True)
+        return MutableSet[self.value_type]._unchecked(self.values())
 
     def values_as_immutable_set(self: ImmutableDict[K, V]) -> ImmutableSet[V]:
         """
@@ -255,4 +262,4 @@ class ImmutableDict[K, V](AbstractDict[K, V]):
         :rtype: ImmutableSet[V]
         """
         from concrete_classes.set import ImmutableSet
-        return ImmutableSet[self.value_type](self.values(), _skip_validation=True)
+        return ImmutableSet[self.value_type]._unchecked(self.values())
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, Callable, TYPE_CHECKING, ClassVar
 
 from abstract_classes.abstract_sequence import AbstractMutableSequence, AbstractSequence
 from abstract_classes.collection import Collection
+from abstract_classes.generic_base import _object_setattr
 
 if TYPE_CHECKING:
     from concrete_classes.dict import MutableDict, ImmutableDict
@@ -59,7 +60,7 @@ class MutableList[T](AbstractMutableSequence[T]):
          order. Validation is skipped when creating this object.
         :type: ImmutableList[T]
         """
-        return ImmutableList[self.item_type](self.values, _skip_validation=True)
+        return ImmutableList[self.item_type]._unchecked(self.values)
 
     def to_mutable_set(self: MutableList[T]) -> MutableSet[T]:
         """
@@ -70,7 +71,7 @@ class MutableList[T](AbstractMutableSequence[T]):
         :type: MutableSet[T]
         """
         from concrete_classes.set import MutableSet
-        return MutableSet[self.item_type](self.values, _skip_validation=True)
+        return MutableSet[self.item_type]._unchecked(self.values)
 
     def to_immutable_set(self: MutableList[T]) -> ImmutableSet[T]:
         """
@@ -81,7 +82,7 @@ class MutableList[T](AbstractMutableSequence[T]):
         :type: ImmutableSet[T]
         """
         from concrete_classes.set import ImmutableSet
-        return ImmutableSet[self.item_type](self.values, _skip_validation=True)
+        return ImmutableSet[self.item_type]._unchecked(self.values)
 
     def to_mutable_dict[K, V](
         self: MutableList[T],
@@ -133,10 +134,15 @@ class ImmutableList[T](AbstractSequence[T]):
 
     It adds some basic methods to transform the list into other classes created in this file: MutableList,
     MutableSet, ImmutableSet, MutableDict and ImmutableDict.
+
+    Its repr is computed lazily and stored on the _repr_cache slot, as long as the repr of its contents can't change.
+    Likewise, its hash is computed the first time it's needed and stored on the _hash_cache slot.
     """
 
     item_type: type[T]
     values: tuple[T, ...]
+    _repr_cache: str | None = field(init=False, repr=False, compare=False)
+    _hash_cache: int | None = field(init=False, repr=False, compare=False)
 
     _comparable_types: ClassVar[type[Collection] | tuple[type[Collection], ...]] = AbstractSequence
 
@@ -165,6 +171,23 @@ class ImmutableList[T](AbstractSequence[T]):
         :type _skip_validation: bool
         """
         Collection.__init__(self, *values, _coerce=_coerce, _skip_validation=_skip_validation)
+        _object_setattr(self, '_repr_cache', None)
+        _object_setattr(self, '_hash_cache', None)
+
+    def __hash__(self: ImmutableList[T]) -> int:
+        """
+        Hashes the ImmutableList by hashing the tuple of its item_type and values, only the first time it's called.
+
+        :return: The hash of the tuple of the item_type and values of the ImmutableList.
+        :rtype: int
+
+        :raises TypeError: If the item type or any of the values isn't hashable.
+        """
+        cached_hash = self._hash_cache
+        if cached_hash is None:
+            cached_hash = hash((self.item_type, self.values))
+            _object_setattr(self, '_hash_cache', cached_hash)
+        return cached_hash
 
     def to_mutable_list(self: ImmutableList[T]) -> MutableList[T]:
         """
@@ -174,7 +197,7 @@ class ImmutableList[T](AbstractSequence[T]):
          order. Validation is skipped when creating this object.
         :type: MutableList[T]
         """
-        return MutableList[self.item_type](self.values, _skip_validation=True)
+        return MutableList[self.item_type]._unchecked(self.values)
 
     def to_mutable_set(self: ImmutableList[T]) -> MutableSet[T]:
         """
@@ -185,7 +208,7 @@ class ImmutableList[T](AbstractSequence[T]):
         :type: MutableSet[T]
         """
         from concrete_classes.set import MutableSet
-        return MutableSet[self.item_type](self.values, _skip_validation=True)
+        return MutableSet[self.item_type]._unchecked(self.values)
 
     def to_immutable_set(self: ImmutableList[T]) -> ImmutableSet[T]:
         """
@@ -196,7 +219,7 @@ class ImmutableList[T](AbstractSequence[T]):
         :type: ImmutableSet[T]
         """
         from concrete_classes.set import ImmutableSet
-        return ImmutableSet[self.item_type](self.values, _skip_validation=True)
+        return ImmutableSet[self.item_type]._unchecked(self.values)
 
     def to_mutable_dict[K, V](
         self: ImmutableList[T],
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Any, Iterator
 
-from abstract_classes.generic_base import GenericBase
+from abstract_classes.generic_base import GenericBase, _object_setattr
 
 
 @dataclass(frozen=True, slots=True, repr=False)
@@ -57,8 +57,8 @@ class Maybe[T](GenericBase):
 
         actual_value = value if _skip_validation else _validate_or_coerce_value(value, generic_item_type, _coerce=_coerce) if value is not None else None
 
-        object.__setattr__(self, 'item_type', generic_item_type)
-        object.__setattr__(self, 'value', actual_value)
+        _object_setattr(self, 'item_type', generic_item_type)
+        _object_setattr(self, 'value', actual_value)
 
     @classmethod
     def _inferred_item_type(cls: Maybe[T]) -> type[T] | None:
@@ -83,14 +83,19 @@ class Maybe[T](GenericBase):
         Returns a Maybe object holding a None value, fetching the item_type from the class itself.
 
         :return: A Maybe object holding a None object. Its item_type is inferred from the dynamic Maybe subclass this
-        method was called on, like Maybe[int].
+        method was called on, like Maybe[int]. The same object is returned by every call on the same subclass.
 
         :raises ValueError: If the method was called upon a class with no generic type. This forbids Maybe.empty(), as
          its item type can't be inferred, only allowing, for example, Maybe[str].empty().
         """
-        if cls._inferred_item_type() is None:
-            raise ValueError(f"Trying to call {cls.__name__}.empty without a generic type.")
-        return cls()
+        # Empty Maybes are immutable, so a single one is created per dynamic subclass and stored on it to be reused.
+        empty = cls.__dict__.get('_empty')
+        if empty is None:
+            if cls._inferred_item_type() is None:
+                raise ValueError(f"Trying to call {cls.__name__}.empty without a generic type.")
+            empty = cls()
+            cls._empty = empty
+        return empty
 
     @classmethod
     def of(cls, value: T) -> Maybe[T]:
@@ -127,7 +132,7 @@ class Maybe[T](GenericBase):
         if item_type is None:
             raise ValueError("You must give a type when using Maybe.of_nullable")
         from type_validation.type_validation import _validate_or_coerce_value
-        return Maybe[item_type](_validate_or_coerce_value(value, item_type)) if value is not None else Maybe[item_type]()
+        return Maybe[item_type](_validate_or_coerce_value(value, item_type)) if value is not None else Maybe[item_type].empty()
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, Callable, ClassVar
 
 from abstract_classes.abstract_set import AbstractMutableSet, AbstractSet
 from abstract_classes.collection import Collection
+from abstract_classes.generic_base import _object_setattr
 from concrete_classes.dict import MutableDict, ImmutableDict
 
 
@@ -55,7 +56,7 @@ class MutableSet[T](AbstractMutableSet[T]):
          skipped when creating this object.
         :type: ImmutableSet[T]
         """
-        return ImmutableSet[self.item_type](self.values, _skip_validation=True)
+        return ImmutableSet[self.item_type]._unchecked(self.values)
 
     def to_mutable_dict[K, V](
         self: MutableSet[T],
@@ -105,10 +106,13 @@ class ImmutableSet[T](AbstractSet[T]):
 
     It adds some basic methods to transform the set into other classes created in this file: MutableSet, MutableDict
     and ImmutableDict.
+
+    Its repr is computed lazily and stored on the _repr_cache slot, as long as the repr of its contents can't change.
     """
 
     item_type: type[T]
     values: frozenset[T]
+    _repr_cache: str | None = field(init=False, repr=False, compare=False)
 
     _comparable_types: ClassVar[type[Collection] | tuple[type[Collection], ...]] = AbstractSet
 
@@ -136,6 +140,18 @@ class ImmutableSet[T](AbstractSet[T]):
         :type _skip_validation: bool
         """
         Collection.__init__(self, *values, _coerce=_coerce, _skip_validation=_skip_validation)
+        _object_setattr(self, '_repr_cache', None)
+
+    def __hash__(self: ImmutableSet[T]) -> int:
+        """
+        Hashes the ImmutableSet by hashing the tuple of its item_type and values, whose frozenset caches its own hash.
+
+        :return: The hash of the tuple of the item_type and values of the ImmutableSet.
+        :rtype: int
+
+        :raises TypeError: If the item type isn't hashable.
+        """
+        return hash((self.item_type, self.values))
 
     def to_mutable_set(self: ImmutableSet[T]) -> MutableSet[T]:
         """
@@ -145,7 +161,7 @@ class ImmutableSet[T](AbstractSet[T]):
          skipped when creating this object.
         :type: MutableSet[T]
         """
-        return MutableSet[self.item_type](self.values, _skip_validation=True)
+        return MutableSet[self.item_type]._unchecked(self.values)
 
     def to_mutable_dict[K, V](
         self: ImmutableSet[T],
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import reduce
+from itertools import chain
+from typing import Callable, Iterable, Iterator
+
+from abstract_classes.collection import Collection, _MISSING, _is_non_str_iterable, _type_validation
+from abstract_classes.generic_base import base_class, class_name, _object_setattr
+
+
+@dataclass(frozen=True, slots=True, repr=False, eq=False)
+class Stream[T]:
+    """
+    A lazy pipeline of operations over the values of a Collection, replicating the laziness of Java's Stream API.
+
+    The intermediate operations (map, filter, flatmap and peek) just compose iterators over the values of the source
+    Collection, so a chain of them is performed in a single pass over the values, without building nor validating any
+    intermediate Collection. The values are only traversed when a terminal operation is called (to_collection,
+    all_match, any_match, none_match or reduce), and like the iterators it composes, a Stream can only be consumed once.
+
+    Attributes:
+        source (Collection): The Collection the Stream was created from.
+
+        values (Iterator[T]): Iterator over the values resulting from the operations applied so far.
+
+        item_type (type[T] | None): The type of the values, if known. It's None after a map or flatmap with no
+         result_type, in which case it's inferred when collecting.
+
+        _validated (bool): True if the values are known to be of item_type already, because they were only filtered or
+         peeked from the source, so collecting them can skip validation.
+    """
+
+    source: Collection
+    values: Iterator[T]
+    item_type: type[T] | None
+    _validated: bool
+
+    def __init__(
+        self: Stream[T],
+        source: Collection,
+        values: Iterable[T] | None = None,
+        item_type: type[T] | None | object = _MISSING,
+        *,
+        _validated: bool = True
+    ) -> None:
+        """
+        Creates a Stream over the values of a Collection, or over the given values derived from it.
+
+        :param source: The Collection the Stream is created from.
+        :type source: Collection
+
+        :param values: Values derived from the ones of source. Defaults to the values of source themselves.
+        :type values: Iterable[T] | None
+
+        :param item_type: The type of the values, or None if unknown. Defaults to the item type of source when it's not
+         passed.
+        :type item_type: type[T] | None | object
+
+        :param _validated: State parameter that, if True, marks the values as already validated for item_type.
+        :type _validated: bool
+        """
+        _object_setattr(self, 'source', source)
+        _object_setattr(self, 'values', iter(source.values if values is None else values))
+        _object_setattr(self, 'item_type', source.item_type if item_type is _MISSING else item_type)
+        _object_setattr(self, '_validated', _validated)
+
+    def __repr__(self) -> str:
+        return f"Stream({self.source!r})"
+
+    def map[R](self: Stream[T], f: Callable[[T], R], result_type: type[R] | None = None) -> Stream[R]:
+        """
+        Lazily maps each value of the Stream to its image by the function f.
+
+        :param f: Function to apply to each value.
+        :type f: Callable[[T], R]
+
+        :param result_type: The type of the images, if known. If None, it's inferred when collecting.
+        :type result_type: type[R] | None
+
+        :return: A new Stream over the images of the values.
+        :rtype: Stream[R]
+        """
+        return Stream(self.source, map(f, self.values), result_type, _validated=False)
+
+    def filter(self: Stream[T], predicate: Callable[[T], bool]) -> Stream[T]:
+        """
+        Lazily keeps only the values of the Stream that satisfy the predicate.
+
+        :param predicate: Function to the booleans that returns True for the values to keep.
+        :type predicate: Callable[[T], bool]
+
+        :return: A new Stream over the values that satisfy the predicate, keeping their type and validation state.
+        :rtype: Stream[T]
+        """
+        return Stream(self.source, filter(predicate, self.values), self.item_type, _validated=self._validated)
+
+    def flatmap[R](self: Stream[T], f: Callable[[T], Iterable[R]], result_type: type[R] | None = None) -> Stream[R]:
+        """
+        Lazily maps each value of the Stream to an iterable by the function f and flattens them.
+
+        :param f: Function returning an iterable (excluding str and bytes) for each value.
+        :type f: Callable[[T], Iterable[R]]
+
+        :param result_type: The type of the flattened values, if known. If None, it's inferred when collecting.
+        :type result_type: type[R] | None
+
+        :return: A new Stream over the flattened images of the values.
+        :rtype: Stream[R]
+
+        :raises TypeError: When the Stream is consumed, if f returns a str, bytes or a non-iterable object.
+        """
+        def checked_f(value: T) -> Iterable[R]:
+            result = f(value)
+            if not _is_non_str_iterable(result):
+                raise TypeError("flatmap function must return a non-string iterable")
+            return result
+
+        return Stream(self.source, chain.from_iterable(map(checked_f, self.values)), result_type, _validated=False)
+
+    def peek(self: Stream[T], consumer: Callable[[T], None]) -> Stream[T]:
+        """
+        Lazily performs the given consumer function on each value as it's traversed, without modifying them.
+
+        :param consumer: A function that takes a value of type T and returns None.
+        :type consumer: Callable[[T], None]
+
+        :return: A new Stream over the same values.
+        :rtype: Stream[T]
+        """
+        def peeked(value: T) -> T:
+            consumer(value)
+            return value
+
+        return Stream(self.source, map(peeked, self.values), self.item_type, _validated=self._validated)
+
+    def all_match(self: Stream[T], predicate: Callable[[T], bool]) -> bool:
+        """
+        Returns True if all values of the Stream satisfy the predicate, stopping at the first one that doesn't.
+
+        :param predicate: Function to the booleans to test the values with.
+        :type predicate: Callable[[T], bool]
+
+        :return: True if all values satisfy the predicate or if the Stream is empty, False otherwise.
+        :rtype: bool
+        """
+        return all(map(predicate, self.values))
+
+    def any_match(self: Stream[T], predicate: Callable[[T], bool]) -> bool:
+        """
+        Returns True if any value of the Stream satisfies the predicate, stopping at the first one that does.
+
+        :param predicate: Function to the booleans to test the values with.
+        :type predicate: Callable[[T], bool]
+
+        :return: True if at least one value satisfies the predicate, False otherwise.
+        :rtype: bool
+        """
+        return any(map(predicate, self.values))
+
+    def none_match(self: Stream[T], predicate: Callable[[T], bool]) -> bool:
+        """
+        Returns True if no value of the Stream satisfies the predicate, stopping at the first one that does.
+
+        :param predicate: Function to the booleans to test the values with.
+        :type predicate: Callable[[T], bool]
+
+        :return: True if no value satisfies the predicate or if the Stream is empty, False otherwise.
+        :rtype: bool
+        """
+        return not any(map(predicate, self.values))
+
+    def reduce(self: Stream[T], f: Callable[[T, T], T], unit: T = _MISSING) -> T:
+        """
+        Reduces the values of the Stream to a single value using a binary operator function and an optional unit.
+
+        :param f: A binary operator that combines two values into one.
+        :type f: Callable[[T, T], T]
+
+        :param unit: Optional initial value for the reduction.
+        :type unit: T
+
+        :return: The result of the reduction, delegated to functools's reduce() function.
+        :rtype: T
+
+        :raises TypeError: If the unit isn't of the item type of the Stream, when it's known.
+        """
+        if unit is _MISSING:
+            return reduce(f, self.values)
+        if self.item_type is not None and not _type_validation()._validate_type(unit, self.item_type):
+            raise TypeError(
+                f"The unit provided {unit} was of type {class_name(type(unit))} "
+                f"instead of {class_name(self.item_type)}"
+            )
+        return reduce(f, self.values, unit)
+
+    def to_collection[C: Collection](
+        self: Stream[T],
+        collection_class: type[C] | None = None,
+        *,
+        _coerce: bool = False
+    ) -> C:
+        """
+        Collects the values of the Stream into a new Collection, performing all the pending operations in one pass.
+
+        :param collection_class: Collection class to collect the values into, with or without generics. Defaults to the
+         base class of the source Collection.
+        :type collection_class: type[C] | None
+
+        :param _coerce: State parameter that, if True, attempts to coerce the values to the target item type.
+        :type _coerce: bool
+
+        :return: A new Collection of the given class containing the values. Its generic type is the one of
+         collection_class if it has one, or else the item type of the Stream if it's known, and validation is only
+         skipped if the values were only filtered or peeked from the source and that type is the item type of the
+         Stream. Otherwise, the item type is inferred from the values.
+        :rtype: C
+
+        :raises TypeError: If the values aren't of the target item type and can't be coerced to it.
+        """
+        target_class: type[C] = base_class(self.source) if collection_class is None else collection_class
+        item_type = target_class._args[0] if hasattr(target_class, '_args') else self.item_type
+        origin_class: type[C] = getattr(target_class, '_origin', target_class)
+        values = list(self.values)
+        if item_type is None:
+            return origin_class.of_iterable(values)
+        skip_validation = self._validated and item_type == self.item_type
+        return origin_class[item_type](values, _coerce=_coerce, _skip_validation=skip_validation)
@@ -1,8 +1,9 @@
-from typing import get_origin, get_args, Union, Any
-from types import UnionType
+from functools import lru_cache
+from itertools import filterfalse, repeat
+from typing import get_origin, get_args, Any
 
 from abstract_classes.collection import Collection
-from abstract_classes.generic_base import GenericBase, class_name
+from abstract_classes.generic_base import GenericBase, class_name, _UNION_ORIGINS
 
 
 def _get_origin_args(tp: type) -> tuple[type, tuple[type, ...]]:
@@ -25,10 +26,40 @@ def _get_origin_args(tp: type) -> tuple[type, tuple[type, ...]]:
     return origin or tp, args
 
 
+def _is_plain_class(tp: Any) -> bool:
+    """
+    Checks if a type is a plain class, with no generics, so being a subtype of another plain class is just issubclass.
+
+    :param tp: Type to check.
+    :type tp: Any
+
+    :return: True if tp is a class other than Any, not called upon generics. False otherwise.
+    :rtype: bool
+    """
+    return isinstance(tp, type) and tp is not Any and get_origin(tp) is None and not hasattr(tp, '_args')
+
+
+def _split_plain_classes(args: tuple[type, ...]) -> tuple[tuple[type, ...], tuple[type, ...]]:
+    """
+    Splits the args of a Union into its plain classes and the rest of its args.
+
+    :param args: Args of the Union.
+    :type args: tuple[type, ...]
+
+    :return: A tuple of the plain classes among args, as described in _is_plain_class, and a tuple of the other args.
+    :rtype: tuple[tuple[type, ...], tuple[type, ...]]
+    """
+    plain_args = tuple(filter(_is_plain_class, args))
+    return plain_args, tuple(filterfalse(_is_plain_class, args))
+
+
 def _is_subtype(tp: type, other: type) -> bool:
     """
     Checks if the first type is a subtype of the other or not, accounting for unions and generics.
 
+    The results are memoized for each pair of types, as the same nested generics are compared again and again when
+    combining Collections, and every comparison recurses through all their arguments.
+
     :param tp: Type to check if it's a subtype.
     :type tp: type
 
@@ -38,6 +69,24 @@ def _is_subtype(tp: type, other: type) -> bool:
     :return: True if tp is a subtype of other, accounting for union of types and generics. False otherwise.
     :rtype: bool
     """
+    # Every type is a subtype of itself and of Any, which is checked before hashing them for the cache.
+    if tp is other or other is Any:
+        return True
+    try:
+        return _cached_is_subtype(tp, other)
+    except TypeError:  # Types with unhashable arguments, like some Literals, can't be cached
+        return _cached_is_subtype.__wrapped__(tp, other)
+
+
+@lru_cache(maxsize=4096)
+def _cached_is_subtype(tp: type, other: type) -> bool:
+    """
+    Checks if the first type is a subtype of the other, as described in _is_subtype, caching the result.
+
+    :param tp: Type to check if it's a subtype.
+    :param other: Type to check if it's a supertype.
+    :return: True if tp is a subtype of other, False otherwise.
+    """
     tp_origin, tp_args = _get_origin_args(tp)
     other_origin, other_args = _get_origin_args(other)
 
@@ -48,12 +97,16 @@ def _is_subtype(tp: type, other: type) -> bool:
         return other is Any
 
     # If "tp" is a Union:
-    if tp_origin in (Union, UnionType):
+    if tp_origin in _UNION_ORIGINS:
         # If "other" is also a Union:
-        if other_origin in (Union, UnionType):
-            # Coverage rule: each arg in tp matches at least one arg in other
+        if other_origin in _UNION_ORIGINS:
+            # Coverage rule: each arg in tp matches at least one arg in other. Plain classes of tp are checked against
+            # all plain classes of other with a single issubclass call, recursing only on the generic args of other.
+            plain_other_args, generic_other_args = _split_plain_classes(other_args)
             return all(
-                any(_is_subtype(t_arg, o_arg) for o_arg in other_args)
+                issubclass(t_arg, plain_other_args) or any(map(_is_subtype, repeat(t_arg), generic_other_args))
+                if _is_plain_class(t_arg)
+                else any(map(_is_subtype, repeat(t_arg), other_args))
                 for t_arg in tp_args
             )
         else:
@@ -64,7 +117,10 @@ def _is_subtype(tp: type, other: type) -> bool:
             )
 
     # If "other" is a Union but "tp" is not.
-    if other_origin in (Union, UnionType):
+    if other_origin in _UNION_ORIGINS:
+        if _is_plain_class(tp):
+            plain_other_args, generic_other_args = _split_plain_classes(other_args)
+            return issubclass(tp, plain_other_args) or any(map(_is_subtype, repeat(tp), generic_other_args))
         return any(
             _is_subtype(tp, o_arg)
             for o_arg in other_args
@@ -117,6 +173,10 @@ def _get_supertype(t: type, other: type) -> type:
 
     :raises TypeError: If none of the give types is supertype to the other.
     """
+    if t is other or other is Any:
+        return other
+    if t is Any:
+        return t
     if _is_subtype(t, other):
         return other
     if _is_subtype(other, t):
@@ -141,6 +201,8 @@ def _get_subtype(t: type, other: type) -> type:
 
     :raises TypeError: If none of the give types is subtype to the other.
     """
+    if t is other:
+        return t
     if _is_subtype(t, other):
         return t
     if _is_subtype(other, t):
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Mapping, Iterable
 
 from abstract_classes.abstract_dict import AbstractDict
@@ -154,4 +156,26 @@ def _infer_type_contained_in_iterable[T](iterable: Iterable[T]) -> type[T]:
     if not iterable:
         raise ValueError("Cannot infer type from an empty iterable.")
 
+    if isinstance(iterable, Iterator):
+        iterable = tuple(iterable)
+
+    # Values whose class holds no generics infer to that class, so only containers need to be inferred one by one.
+    value_classes = set(map(type, iterable))
+    if not any(map(_is_container_class, value_classes)):
+        return _combine_types(value_classes)
+
     return _combine_types({_infer_type(val) for val in iterable})
+
+
+@lru_cache(maxsize=256)
+def _is_container_class(cls: type) -> bool:
+    """
+    Checks if the type of the instances of a class is inferred from their contents, as described in _infer_type.
+
+    :param cls: Class to check.
+    :type cls: type
+
+    :return: True if the class is a tuple, Mapping or non-atomic Iterable class, False otherwise.
+    :rtype: bool
+    """
+    return issubclass(cls, (tuple, *MAPPING_TYPES)) or (issubclass(cls, Iterable) and not issubclass(cls, ATOMIC_ITERABLES))
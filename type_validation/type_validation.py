@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from types import UnionType
-from typing import Iterable, Any, get_origin, get_args, Union, Annotated, Literal, Mapping, Sequence, Callable
+from functools import lru_cache
+from itertools import repeat
+from typing import Iterable, Any, get_origin, get_args, Annotated, Literal, Mapping, Sequence, Callable
 
 from abstract_classes.abstract_dict import AbstractDict
+from abstract_classes.abstract_set import AbstractSet
 from abstract_classes.collection import Collection
-from abstract_classes.generic_base import class_name
+from abstract_classes.generic_base import class_name, _UNION_ORIGINS
 from concrete_classes.maybe import Maybe
 
 import sys
@@ -13,6 +15,15 @@ import sys
 
 MAX_EXACT_INT_FLOAT: int = 2**sys.float_info.mant_dig
 
+# Exact classes of the values that calling each of these types on gives the same result as the _coerce=True coercions
+# of _validate_or_coerce_value. bool is left out of the numeric ones, as validation keeps it unchanged for int.
+_MAP_COERCIBLE_CLASSES: dict[type, frozenset[type]] = {
+    str: frozenset({str, int, float, complex, bool}),
+    int: frozenset({int, str}),
+    float: frozenset({float, str}),
+    complex: frozenset({complex, str}),
+}
+
 
 def _validate_type(obj: Any, expected_type: type) -> bool:
     """
@@ -27,18 +38,25 @@ def _validate_type(obj: Any, expected_type: type) -> bool:
     :return: True if the object is an instance of the expected type, matching its generics too. False otherwise.
     :rtype: bool
     """
-    if expected_type is Any:
+    # An object whose exact class is the expected type validates it, even for dynamic generic subclasses, whose values
+    # were already validated when the object was built.
+    if type(obj) is expected_type:
         return True
 
-    origin = get_origin(expected_type)
-    args = get_args(expected_type)
+    # Plain classes with no metaclass nor generics are dispatched straight to isinstance.
+    if type(expected_type) is type and not hasattr(expected_type, '_args'):
+        return isinstance(obj, expected_type)
 
-    if origin is None and hasattr(expected_type, '_args'):
-        origin = expected_type._origin
-        args = expected_type._args
+    if expected_type is Any:
+        return True
 
-    if origin in (Union, UnionType):
-        return any(_validate_type(obj, arg) for arg in args)
+    try:
+        origin, args = _origin_and_args(expected_type)
+    except TypeError:  # Types with unhashable arguments, like some Literals, can't be cached
+        origin, args = _origin_and_args.__wrapped__(expected_type)
+
+    if origin in _UNION_ORIGINS:
+        return any(map(_validate_type, repeat(obj), args))
 
     if origin is Annotated:
         return _validate_type(obj, args[0])
@@ -64,6 +82,20 @@ def _validate_type(obj: Any, expected_type: type) -> bool:
     return False
 
 
+@lru_cache(maxsize=2048)
+def _origin_and_args(expected_type: type) -> tuple[Any, tuple]:
+    """
+    Gets the origin and args of a type, taking them from the _origin and _args attributes of the classes generated by
+    GenericBase's __class_getitem__. Cached, as the same nested types are dispatched again for every value validated.
+
+    :param expected_type: Type to get the origin and args of.
+    :return: A tuple of the origin of the type, or None if it has none, and the tuple of its args.
+    """
+    if hasattr(expected_type, '_args') and get_origin(expected_type) is None:
+        return expected_type._origin, expected_type._args
+    return get_origin(expected_type), get_args(expected_type)
+
+
 def _validate_iterable[T](obj: Any, iterable_type: type[Iterable[T]], item_type: type[T]) -> bool:
     """
     Validates that all items in an iterable are of the expected type.
@@ -80,7 +112,7 @@ def _validate_iterable[T](obj: Any, iterable_type: type[Iterable[T]], item_type:
     """
     if not isinstance(obj, iterable_type) or isinstance(obj, (str, bytes)):
         return False
-    return all(_validate_type(item, item_type) for item in obj)
+    return _validate_all(obj, item_type)
 
 
 def _validate_mapping(obj: Any, mapping_type: type, key_value_types: tuple[type, type]) -> bool:
@@ -106,7 +138,7 @@ def _validate_mapping(obj: Any, mapping_type: type, key_value_types: tuple[type,
         raise ValueError(f"_validate_mapping method called with a tuple argument {key_value_types} of length {len(key_value_types)} != 2.")
 
     key_type, val_type = key_value_types
-    return all(_validate_type(key, key_type) and _validate_type(value, val_type) for key, value in obj.items())
+    return _validate_all(obj.keys(), key_type) and _validate_all(obj.values(), val_type)
 
 
 def _validate_tuple(obj: Any, args: tuple) -> bool:
@@ -128,12 +160,12 @@ def _validate_tuple(obj: Any, args: tuple) -> bool:
 
     # Case tuple[type, ...]
     if len(args) == 2 and args[1] is Ellipsis:
-        return all(_validate_type(v, args[0]) for v in obj)
+        return _validate_all(obj, args[0])
 
     if len(obj) != len(args):
         return False
 
-    return all(_validate_type(v, t) for v, t in zip(obj, args))
+    return all(map(_validate_type, obj, args))
 
 
 def _validate_maybe(obj: Any, args: Any) -> bool:
@@ -155,6 +187,71 @@ def _validate_maybe(obj: Any, args: Any) -> bool:
     return obj.item_type == args and (obj.value is None or _validate_type(obj.value, args))
 
 
+def _plain_classes(expected_type: type) -> tuple[type, ...] | None:
+    """
+    Gets the tuple of classes that an object must be an instance of to validate a type, if isinstance is enough for it.
+
+    :param expected_type: Type to get the classes of.
+    :type expected_type: type
+
+    :return: A tuple containing expected_type if it's a class with no generics, or the members of expected_type if it
+     is a Union of such classes. None if validating the type requires more than an isinstance check.
+    :rtype: tuple[type, ...] | None
+    """
+    # Plain classes with no metaclass nor generics, the most common case, need no further introspection.
+    if type(expected_type) is type and not hasattr(expected_type, '_args'):
+        return (expected_type,)
+
+    # Otherwise, the introspection is only performed once for each type, as the same nested types are validated again
+    # for each value of a Collection or item of a container.
+    try:
+        return _cached_plain_classes(expected_type)
+    except TypeError:  # Types with unhashable arguments, like some Literals, can't be cached
+        return _cached_plain_classes.__wrapped__(expected_type)
+
+
+@lru_cache(maxsize=1024)
+def _cached_plain_classes(expected_type: type) -> tuple[type, ...] | None:
+    """
+    Gets the tuple of classes that an object must be an instance of to validate a type, as described in _plain_classes.
+
+    :param expected_type: Type to get the classes of.
+    :return: The tuple of classes, or None if validating the type requires more than an isinstance check.
+    """
+    if get_origin(expected_type) in _UNION_ORIGINS:
+        members = get_args(expected_type)
+    else:
+        members = (expected_type,)
+
+    # Classes called upon generics, like AbstractSet[int], are validated by their _origin and _args instead.
+    if all(
+        isinstance(member, type) and member is not Any and get_origin(member) is None and not hasattr(member, '_args')
+        for member in members
+    ):
+        return members
+    return None
+
+
+def _validate_all(values: Iterable[Any], expected_type: type) -> bool:
+    """
+    Validates that all the given values are of an expected type, specializing the check once for the whole iterable.
+
+    :param values: Values to validate.
+    :type values: Iterable[Any]
+
+    :param expected_type: Type to check if the values are instances of.
+    :type expected_type: type
+
+    :return: True if all values validate the expected type, False otherwise. If the expected type is a plain class or
+     a union of them, the values are checked with isinstance within C, otherwise each goes through _validate_type.
+    :rtype: bool
+    """
+    plain_classes = _plain_classes(expected_type)
+    if plain_classes is not None:
+        return all(map(isinstance, values, repeat(plain_classes)))
+    return all(map(_validate_type, values, repeat(expected_type)))
+
+
 def _validate_or_coerce_value[T](
     obj: object,
     expected_type: type[T],
@@ -186,9 +283,35 @@ def _validate_or_coerce_value[T](
 
     :raises TypeError: If obj doesn't match item_type and cannot be safely coerced.
     """
-    if _validate_type(obj, expected_type):
+    # Values of exactly the expected class are always valid, so the generic dispatch of _validate_type is avoided.
+    if type(obj) is expected_type or _validate_type(obj, expected_type):
         return obj
+    return _coerce_value(obj, expected_type, _coerce=_coerce)
+
+
+def _coerce_value[T](
+    obj: object,
+    expected_type: type[T],
+    *,
+    _coerce: bool = False
+) -> T:
+    """
+    Coerces an object already known not to be of a given type to it, following the rules of _validate_or_coerce_value.
 
+    :param obj: Value to coerce, which must have failed the validation against expected_type.
+    :type obj: object
+
+    :param expected_type: Type to coerce obj into.
+    :type expected_type: type[T]
+
+    :param _coerce: True if you want additional type coercions to happen. Defaulted to False.
+    :type _coerce: bool
+
+    :returns: The coercion of obj to the expected type, if it's valid.
+    :rtype: T
+
+    :raises TypeError: If obj cannot be safely coerced to expected_type.
+    """
     # *********** Safe coercions ***********
     if expected_type in (float, complex) and isinstance(obj, (int, bool)):
         if abs(obj) > MAX_EXACT_INT_FLOAT:
@@ -215,6 +338,24 @@ def _validate_or_coerce_value[T](
     raise TypeError(f"Value {obj!r} is not of type {class_name(expected_type)} and couldn't be safely coerced to it.")
 
 
+def _finish_copy[T](values: Iterable[T], finisher: Callable[[Iterable[T]], Iterable[T]]) -> Iterable[T]:
+    """
+    Applies a finisher to some already validated values, making sure the result doesn't share a mutable container.
+
+    :param values: Values to apply the finisher to.
+    :type values: Iterable[T]
+
+    :param finisher: Callable to apply to the values.
+    :type finisher: Callable[[Iterable[T]], Iterable[T]]
+
+    :return: The finisher applied to the values. The finisher copies the container at C level, unless it was already of
+     the desired type, in which case it is copied here if it's mutable, so the caller's container isn't shared.
+    :rtype: Iterable[T]
+    """
+    finished = finisher(values)
+    return finished.copy() if finished is values and isinstance(finished, (list, set)) else finished
+
+
 def _validate_or_coerce_iterable[T](
     iterable: Iterable[Any] | None,
     expected_type: type[T],
@@ -245,6 +386,40 @@ def _validate_or_coerce_iterable[T](
     """
     if iterable is None:
         return _finisher()
+
+    # The values of a Collection are read from its underlying container instead of being copied, and if its item type
+    # is the expected one, they were already validated when it was built.
+    if isinstance(iterable, Collection):
+        if iterable.item_type == expected_type:
+            return _finish_copy(iterable.values, _finisher)
+        iterable = iterable.values
+
+    # Fast path: if the expected type is a plain class or a union of them, validating a value is the same as checking
+    # isinstance against a tuple of classes, so the whole iterable is checked within C by all and map, and only if a
+    # value fails it, the per-value validation and coercion is performed.
+    plain_classes = _plain_classes(expected_type)
+    if plain_classes is not None:
+        if not isinstance(iterable, (list, tuple, set, frozenset)):
+            iterable = tuple(iterable)
+        if all(map(isinstance, iterable, repeat(plain_classes))):
+            return _finish_copy(iterable, _finisher)
+
+        # Coercion fast path: if every value is of a class the expected type can be called upon to coerce it, the
+        # expected type is mapped over the iterable within C. A ValueError on a str leaves it to the per-value path.
+        coercible_classes = _MAP_COERCIBLE_CLASSES.get(expected_type) if _coerce else None
+        if coercible_classes is not None and coercible_classes.issuperset(map(type, iterable)):
+            try:
+                return _finisher(map(expected_type, iterable))
+            except ValueError:
+                pass
+
+        # Specialized per-value loop: validating a value is a single isinstance check against the classes, so the values
+        # failing it go straight to _coerce_value, skipping the generic dispatch of _validate_type.
+        return _finisher(
+            value if isinstance(value, plain_classes) else _coerce_value(value, expected_type, _coerce=_coerce)
+            for value in iterable
+        )
+
     return _finisher(_validate_or_coerce_value(value, expected_type, _coerce=_coerce) for value in iterable)
 
 
@@ -275,12 +450,16 @@ def _validate_or_coerce_iterable_of_iterables[T](
     :type _outer_finisher: Callable[[Iterable[T]], Iterable[T]]
 
     :return: An Iterable containing the validated and optionally coerced iterables. The outer type is determined by the
-     return type of _outer_finisher, and the inner type by _inner_finisher.
+     return type of _outer_finisher, and the inner type by _inner_finisher. AbstractSets whose item type is exactly the
+     expected type are already known to be valid, so their underlying containers are passed through unmodified.
     :rtype: Iterable[Iterable[T]]
     """
     other_iterables: list = []
     for iterable in iterables:
-        other_iterables.append(_validate_or_coerce_iterable(iterable, expected_type, _coerce=_coerce, _finisher=_inner_finisher))
+        if isinstance(iterable, AbstractSet) and iterable.item_type == expected_type:
+            other_iterables.append(iterable.values)
+        else:
+            other_iterables.append(_validate_or_coerce_iterable(iterable, expected_type, _coerce=_coerce, _finisher=_inner_finisher))
     return _outer_finisher(other_iterables)
 
 